@@ -1,10 +1,12 @@
 """Directory scanner module for hashing files in a directory structure."""
+import os
 import sys
 import zlib
 import hashlib
+from contextlib import nullcontext
 from pathlib import Path
 from dataclasses import dataclass
-from typing import List, Dict, Optional, Callable
+from typing import List, Dict, Optional, Callable, Iterator, Tuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from collections import defaultdict
 from rich.console import Console
@@ -22,6 +24,39 @@ def format_size(size_bytes: int) -> str:
     return f"{size_bytes:.1f} PB"
 
 
+def walk_with_stats(directory: Path) -> Iterator[Tuple[str, int, float]]:
+    """
+    Recursively walk a directory with os.scandir, yielding file stats.
+
+    One pass gives both the file list and the size/mtime of every file,
+    without building a Path or issuing a separate stat() per entry.
+    Unreadable directories are skipped, like Path.rglob().
+
+    Args:
+        directory: Directory to walk
+
+    Yields:
+        (path, file_size, mtime) for every regular file; path is a string
+        starting with str(directory) + os.sep
+    """
+    pending = [str(directory)]
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.is_file():
+                            stat = entry.stat()
+                            yield entry.path, stat.st_size, stat.st_mtime
+                    except OSError:
+                        pass
+        except OSError:
+            pass
+
+
 @dataclass(frozen=True)
 class DirectoryFileInfo:
     """Represents a file in a directory (comparable to ZipFileInfo)."""
@@ -66,7 +101,8 @@ class DirectoryScanner:
     def scan_directory(
         self,
         directory: Path,
-        progress_callback: Optional[Callable[[str, int, int], None]] = None
+        progress_callback: Optional[Callable[[str, int, int], None]] = None,
+        progress: Optional[Progress] = None
     ) -> List[DirectoryFileInfo]:
         """
         Scan a directory and compute hashes for all files.
@@ -74,6 +110,8 @@ class DirectoryScanner:
         Args:
             directory: Directory to scan
             progress_callback: Optional callback(file_path, current, total)
+            progress: Optional running Progress to add this scan's task to,
+                so several scans can share one live display
 
         Returns:
             List of DirectoryFileInfo objects
@@ -95,14 +133,21 @@ class DirectoryScanner:
 
         files: List[DirectoryFileInfo] = []
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(bar_width=40),
-            TaskProgressColumn(),
-            console=console
-        ) as progress:
-            task = progress.add_task("Scanning directory...", total=len(file_paths))
+        if progress is None:
+            label = "Scanning directory..."
+            progress_ctx = Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(bar_width=40),
+                TaskProgressColumn(),
+                console=console
+            )
+        else:
+            label = f"Scanning {directory.name}..."
+            progress_ctx = nullcontext(progress)
+
+        with progress_ctx as progress:
+            task = progress.add_task(label, total=len(file_paths))
 
             for i, file_path in enumerate(file_paths):
                 try:
@@ -127,7 +172,7 @@ class DirectoryScanner:
                 progress.update(
                     task,
                     advance=1,
-                    description=f"Scanning directory... ({len(files)} files)"
+                    description=f"{label} ({len(files)} files)"
                 )
 
         console.print(f"[green]Scanned {len(files)} files[/green]")
@@ -104,13 +104,25 @@ class FileExtractor:
             # Ensure parent directory exists
             destination.parent.mkdir(parents=True, exist_ok=True)
 
-            # Handle collision
-            final_dest = self.resolve_collision(destination)
-
-            # Extract file
+            # Open the member first so a bad entry never creates a destination file
             with zip_ref.open(file_info.file_path) as src:
-                with open(final_dest, 'wb') as dst:
-                    shutil.copyfileobj(src, dst)
+                # Handle collision. Create exclusively so concurrent extractions
+                # (other zips in other processes) can never overwrite each other
+                while True:
+                    final_dest = self.resolve_collision(destination)
+                    try:
+                        dst = open(final_dest, 'xb')
+                        break
+                    except FileExistsError:
+                        continue
+
+                # Extract file, removing the partial copy if it fails
+                try:
+                    with dst:
+                        shutil.copyfileobj(src, dst)
+                except BaseException:
+                    final_dest.unlink(missing_ok=True)
+                    raise
 
             return ExtractionResult(
                 file_info=file_info,
@@ -273,16 +285,43 @@ def extract_all_unique(
         total_bytes += summary.bytes_extracted
 
         # Show summary for this zip
-        if summary.error_count > 0:
-            progress_console.print(
-                f"  [green]{summary.extracted_count} extracted[/green], "
-                f"[red]{summary.error_count} errors[/red]"
-            )
-            for err in summary.errors[:3]:  # Show first 3 errors
-                progress_console.print(f"    [dim red]{err}[/dim red]")
-            if len(summary.errors) > 3:
-                progress_console.print(f"    [dim]...and {len(summary.errors) - 3} more errors[/dim]")
-        else:
-            progress_console.print(f"  [green]{summary.extracted_count} files extracted[/green]")
+        print_zip_summary(summary, progress_console)
 
     return total_extracted, total_errors, total_bytes
+
+
+def extract_zip(zip_path: Path, files_to_extract: List[Tuple[ZipFileInfo, Path]]) -> ZipExtractionSummary:
+    """
+    Extract files from a single zip without any console output.
+
+    Top-level and side-effect free apart from the files written, so it can
+    be submitted to a ProcessPoolExecutor (one zip per worker).
+
+    Args:
+        zip_path: Path to the zip file
+        files_to_extract: List of (ZipFileInfo, destination_path) tuples
+
+    Returns:
+        ZipExtractionSummary with extraction statistics
+    """
+    base_dir = Path(files_to_extract[0][1]).parts[0] if files_to_extract else "extracted"
+    extractor = FileExtractor(base_dir=Path(base_dir))
+    return extractor.extract_unique_files(zip_path, files_to_extract)
+
+
+def print_zip_summary(summary: ZipExtractionSummary, progress_console: Console = None) -> None:
+    """Print the extracted/error counts (and first few errors) for one zip."""
+    if progress_console is None:
+        progress_console = console
+
+    if summary.error_count > 0:
+        progress_console.print(
+            f"  [green]{summary.extracted_count} extracted[/green], "
+            f"[red]{summary.error_count} errors[/red]"
+        )
+        for err in summary.errors[:3]:  # Show first 3 errors
+            progress_console.print(f"    [dim red]{err}[/dim red]")
+        if len(summary.errors) > 3:
+            progress_console.print(f"    [dim]...and {len(summary.errors) - 3} more errors[/dim]")
+    else:
+        progress_console.print(f"  [green]{summary.extracted_count} files extracted[/green]")
@@ -1,4 +1,5 @@
 """HTML Exporter module for generating styled analysis reports with charts."""
+import os
 import sys
 import json
 import webbrowser
@@ -12,28 +13,23 @@ from scanner import ZipFileInfo
 console = Console(legacy_windows=(sys.platform == "win32"))
 
 
+# Extension -> file type category, built once at import
+FILE_TYPE_EXTENSIONS = {
+    'image': {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.heic', '.raw', '.tiff', '.svg'},
+    'video': {'.mp4', '.mov', '.avi', '.mkv', '.wmv', '.flv', '.webm', '.m4v', '.3gp'},
+    'audio': {'.mp3', '.wav', '.flac', '.aac', '.ogg', '.wma', '.m4a'},
+    'document': {'.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx', '.txt', '.rtf', '.odt'},
+    'data': {'.json', '.xml', '.csv', '.html', '.htm'},
+}
+FILE_TYPE_BY_EXTENSION = {
+    ext: file_type for file_type, exts in FILE_TYPE_EXTENSIONS.items() for ext in exts
+}
+
+
 def get_file_type(file_path: str) -> str:
     """Determine file type category from extension."""
-    ext = Path(file_path).suffix.lower()
-
-    image_exts = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.heic', '.raw', '.tiff', '.svg'}
-    video_exts = {'.mp4', '.mov', '.avi', '.mkv', '.wmv', '.flv', '.webm', '.m4v', '.3gp'}
-    audio_exts = {'.mp3', '.wav', '.flac', '.aac', '.ogg', '.wma', '.m4a'}
-    doc_exts = {'.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx', '.txt', '.rtf', '.odt'}
-    data_exts = {'.json', '.xml', '.csv', '.html', '.htm'}
-
-    if ext in image_exts:
-        return 'image'
-    elif ext in video_exts:
-        return 'video'
-    elif ext in audio_exts:
-        return 'audio'
-    elif ext in doc_exts:
-        return 'document'
-    elif ext in data_exts:
-        return 'data'
-    else:
-        return 'other'
+    ext = os.path.splitext(file_path)[1].lower()
+    return FILE_TYPE_BY_EXTENSION.get(ext, 'other')
 
 
 def format_file_size(size_bytes: int) -> str:
@@ -235,7 +231,7 @@ def create_html_report(
             rows.append({
                 'zip_name': file_info.zip_path.name,
                 'file_path': file_info.file_path,
-                'file_name': Path(file_info.file_path).name,
+                'file_name': file_info.basename,
                 'file_hash': file_hash[:12] + '...' if len(file_hash) > 12 else file_hash,
                 'full_hash': file_hash,
                 'is_duplicate': not is_first,
@@ -1038,7 +1034,7 @@ def generate_largest_files(files: List[ZipFileInfo]) -> str:
     for f in files:
         items.append(f'''
             <div class="top-file-item">
-                <div class="top-file-name" title="{f.file_path}">{Path(f.file_path).name}</div>
+                <div class="top-file-name" title="{f.file_path}">{f.basename}</div>
                 <div class="top-file-type">{get_file_type(f.file_path)}</div>
                 <div class="top-file-size">{format_file_size(f.file_size)}</div>
             </div>
@@ -1270,7 +1266,7 @@ def generate_cleanup_tab(
                 for dup_file, orig_file in file_pairs[:10]:  # Show first 10
                     html_parts.append(f'''
                                 <span style="background: #334155; padding: 4px 8px; border-radius: 4px; font-size: 0.8rem; color: #e2e8f0;">
-                                    {Path(dup_file.file_path).name}
+                                    {dup_file.basename}
                                 </span>
                     ''')
                 if len(file_pairs) > 10:
@@ -1,13 +1,17 @@
 """Main entry point for Google Takeout Tool."""
+import os
 import sys
 import argparse
 import queue
+import threading
 import json
+import hashlib
+import zipfile
 from pathlib import Path
-from typing import Dict, List, Tuple, Set
+from typing import Dict, List, Tuple, Set, Optional, Iterable
 from datetime import datetime
-from collections import defaultdict
-from concurrent.futures import ThreadPoolExecutor
+from collections import defaultdict, Counter
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
@@ -19,16 +23,103 @@ from metadata import extract_dates_batch
 from organizer import propose_location
 from html_exporter import create_html_report, open_html, format_file_size, get_file_type
 from progress_display import SimpleProgressDisplay
-from cache import TakeoutCache
-from extractor import extract_all_unique, format_size
+from cache import TakeoutCache, get_cache
+from extractor import extract_all_unique, extract_zip, print_zip_summary, ZipExtractionSummary, format_size
 from cleanup import CleanupManager, CleanupMode
 from comparator import ZipDirectoryComparator
-from directory_scanner import DirectoryScanner, DirectoryFileInfo
+from directory_scanner import DirectoryScanner, DirectoryFileInfo, walk_with_stats
 
 # Create console with legacy Windows support if needed
 console = Console(legacy_windows=(sys.platform == "win32"))
 
 
+# Static stylesheet for the post-extraction report (kept out of the per-call f-string)
+EXTRACTION_REPORT_STYLE = """    <style>
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+            background: #0f172a;
+            color: #e2e8f0;
+            line-height: 1.6;
+            padding: 40px;
+        }
+        .container { max-width: 1200px; margin: 0 auto; }
+        header {
+            background: linear-gradient(135deg, #059669 0%, #0f172a 100%);
+            border: 1px solid #34d399;
+            padding: 30px;
+            margin-bottom: 30px;
+            border-radius: 16px;
+        }
+        header h1 { font-size: 2rem; margin-bottom: 8px; color: #fff; }
+        header p { color: #94a3b8; }
+        .stats-grid {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+            gap: 16px;
+            margin-bottom: 30px;
+        }
+        .stat-card {
+            background: #1e293b;
+            border: 1px solid #334155;
+            padding: 20px;
+            border-radius: 12px;
+            text-align: center;
+        }
+        .stat-card h3 { font-size: 2rem; color: #34d399; margin-bottom: 4px; }
+        .stat-card.warning h3 { color: #fbbf24; }
+        .stat-card.error h3 { color: #f87171; }
+        .stat-card p { color: #94a3b8; font-size: 0.85rem; }
+        .section { margin-bottom: 30px; }
+        .section-title {
+            font-size: 1.2rem;
+            color: #fff;
+            margin-bottom: 16px;
+            padding-bottom: 8px;
+            border-bottom: 1px solid #334155;
+        }
+        table {
+            width: 100%;
+            border-collapse: collapse;
+            background: #1e293b;
+            border-radius: 12px;
+            overflow: hidden;
+        }
+        th {
+            background: #0f172a;
+            padding: 14px 16px;
+            text-align: left;
+            font-weight: 600;
+            color: #94a3b8;
+            font-size: 0.85rem;
+        }
+        td {
+            padding: 12px 16px;
+            border-bottom: 1px solid #334155;
+        }
+        tr:hover { background: #334155; }
+        .badge {
+            display: inline-block;
+            padding: 4px 10px;
+            border-radius: 6px;
+            font-size: 0.75rem;
+            font-weight: 500;
+        }
+        .badge.image { background: #1e3a5f; color: #60a5fa; }
+        .badge.video { background: #450a0a; color: #f87171; }
+        .badge.audio { background: #2e1065; color: #a78bfa; }
+        .badge.document { background: #422006; color: #fbbf24; }
+        .badge.data { background: #052e16; color: #34d399; }
+        .badge.other { background: #1f2937; color: #9ca3af; }
+        footer {
+            text-align: center;
+            padding: 30px;
+            color: #64748b;
+            font-size: 0.85rem;
+        }
+    </style>"""
+
+
 def display_banner():
     """Display the application banner."""
     banner = Text("Google Takeout Tool", style="bold cyan")
@@ -36,10 +127,74 @@ def display_banner():
     console.print()
 
 
-def run_analysis(files: List[ZipFileInfo], cache: TakeoutCache) -> Tuple[Dict, Dict, Dict]:
+def extract_dates_with_progress(
+    files: List[ZipFileInfo],
+    cache: TakeoutCache,
+    verbose: bool = False,
+    zip_mtimes: Optional[Dict[Path, float]] = None
+) -> Dict[ZipFileInfo, datetime]:
+    """
+    Run extract_dates_batch on a background thread while showing progress.
+
+    extract_dates_batch parallelizes by zip internally, so a single plain
+    thread is enough to keep the progress display responsive.
+
+    Args:
+        files: Files to extract dates for
+        cache: Cache for previously extracted dates
+        verbose: Print the date-source breakdown for each zip
+        zip_mtimes: Zip modification times from scan_directory
+
+    Returns:
+        Dictionary mapping file -> datetime
+    """
+    result_queue: queue.Queue = queue.Queue()
+    outcome: Dict[str, object] = {}
+
+    def worker() -> None:
+        try:
+            outcome["dates"] = extract_dates_batch(
+                files, result_queue, cache, verbose=verbose, zip_mtimes=zip_mtimes
+            )
+        except BaseException as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=worker, name="date-extraction", daemon=True)
+    thread.start()
+
+    with SimpleProgressDisplay("Extracting dates", len(files)) as progress:
+        processed = 0
+        while processed < len(files):
+            try:
+                file_info = result_queue.get(timeout=0.1)
+                progress.update(file_info.get_display_path())
+                processed += 1
+            except queue.Empty:
+                # Every result is queued before the worker returns
+                if not thread.is_alive():
+                    break
+
+    thread.join()
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["dates"]
+
+
+def run_analysis(
+    files: List[ZipFileInfo],
+    cache: TakeoutCache,
+    verbose: bool = False,
+    zip_mtimes: Optional[Dict[Path, float]] = None
+) -> Tuple[Dict, Dict, Dict]:
     """
     Run the core analysis pipeline (steps 2-4).
 
+    Args:
+        files: Files found in the zips
+        cache: Cache for previously extracted dates
+        verbose: Print the date-source breakdown for each zip
+        zip_mtimes: Zip modification times from scan_directory
+
     Returns:
         Tuple of (hash_map, file_dates, proposed_locations)
     """
@@ -50,22 +205,7 @@ def run_analysis(files: List[ZipFileInfo], cache: TakeoutCache) -> Tuple[Dict, D
 
     # Step 3: Extract metadata
     console.print("[bold]Step 3:[/bold] Extracting date metadata")
-    result_queue: queue.Queue = queue.Queue()
-
-    with ThreadPoolExecutor(max_workers=1) as executor:
-        future = executor.submit(extract_dates_batch, files, result_queue, cache)
-
-        with SimpleProgressDisplay("Extracting dates", len(files)) as progress:
-            processed = 0
-            while processed < len(files):
-                try:
-                    file_info = result_queue.get(timeout=0.1)
-                    progress.update(file_info.get_display_path())
-                    processed += 1
-                except:
-                    pass
-
-        file_dates = future.result()
+    file_dates = extract_dates_with_progress(files, cache, verbose=verbose, zip_mtimes=zip_mtimes)
 
     console.print("[green]Date extraction complete[/green]")
     console.print()
@@ -128,7 +268,7 @@ def generate_manifest(
 
 def cmd_analyze(args):
     """Execute the analyze command (generate report only)."""
-    cache = TakeoutCache()
+    cache = get_cache()
     if args.clear_cache:
         cache.clear()
         console.print("[yellow]Cache cleared[/yellow]")
@@ -143,7 +283,7 @@ def cmd_analyze(args):
     try:
         # Step 1: Scan directory
         console.print("[bold]Step 1:[/bold] Scanning zip files in directory")
-        files = scan_directory(args.input_dir)
+        files, zip_mtimes = scan_directory(args.input_dir)
 
         if not files:
             console.print("[red]No files found. Exiting.[/red]")
@@ -151,7 +291,9 @@ def cmd_analyze(args):
         console.print()
 
         # Steps 2-4: Analysis
-        hash_map, file_dates, proposed_locations = run_analysis(files, cache)
+        hash_map, file_dates, proposed_locations = run_analysis(
+            files, cache, verbose=args.verbose, zip_mtimes=zip_mtimes
+        )
 
         # Step 5: Generate HTML report
         console.print("[bold]Step 5:[/bold] Generating HTML report")
@@ -177,31 +319,213 @@ def cmd_analyze(args):
         console.print(f"[dim]Use 'reconcile {manifest_path}' to compare against output directory[/dim]")
 
     finally:
-        cache.close()
+        cache.flush()
+
+
+def strip_base_dir(proposed: str) -> str:
+    """
+    Drop the leading base directory from a proposed location.
+
+    propose_location() returns "{base_dir}/{year}/{month}/{filename}"; this
+    returns "{year}/{month}/{filename}" using string ops instead of building
+    two Path objects per file.
+    """
+    sep_index = proposed.find(os.sep)
+    return proposed[sep_index + 1:] if sep_index >= 0 else proposed
+
+
+def check_cached(
+    entries: List[Tuple[str, int, float]],
+    cached_files: Dict[str, Tuple[int, int, str]],
+    existing_hashes: Set[str],
+    existing_by_size: Dict[int, Set[str]],
+    output_dir: Path
+) -> List[Path]:
+    """
+    Resolve output-directory files against the directory cache.
+
+    Files whose size and mtime match their cached entry have their cached
+    content key added to existing_hashes/existing_by_size in place. Kept
+    free of Rich/console calls and fully typed so this hot loop stays
+    self-contained (and could be compiled with mypyc unchanged).
+
+    Args:
+        entries: (path, size, mtime) tuples from walk_with_stats(output_dir)
+        cached_files: Cached entries from TakeoutCache.get_directory_files()
+        existing_hashes: Set of known content keys (updated in place)
+        existing_by_size: Known content keys by file size (updated in place)
+        output_dir: Output directory the cached paths are relative to
+
+    Returns:
+        Files that are new or changed and still need hashing
+    """
+    files_to_hash: List[Path] = []
+    add_hash = existing_hashes.add
+    get_cached = cached_files.get
+    # Walked paths all start with "{output_dir}{sep}", so slice instead of relative_to()
+    prefix_len = len(str(output_dir)) + 1
+
+    for path, file_size, file_mtime in entries:
+        rel_path = path[prefix_len:]
+
+        # Use cached hash if size and mtime still match
+        cached = get_cached(rel_path)
+        if cached is not None:
+            cached_size, cached_mtime, cached_key = cached
+            if cached_size == file_size and cached_mtime == int(file_mtime):
+                add_hash(cached_key)
+                existing_by_size[file_size].add(cached_key)
+                continue
+
+        # Need to compute hash for this file
+        files_to_hash.append(Path(path))
+
+    return files_to_hash
+
+
+def check_zip_against_output(
+    zip_path: Path,
+    zip_files: List[ZipFileInfo],
+    existing_by_size: Dict[int, Set[str]]
+) -> List[Tuple[ZipFileInfo, Optional[str]]]:
+    """
+    Check files from a single zip against content keys already in the output directory.
+
+    Opens its own ZipFile so it can safely run in a worker thread.
+
+    Args:
+        zip_path: Path to the zip archive
+        zip_files: Files from this zip whose size matches an existing file
+        existing_by_size: Existing content keys indexed by file size
+
+    Returns:
+        List of (file_info, matching_key) tuples; matching_key is None when the
+        file was not found in the output (or could not be read) and needs extraction
+    """
+    results: List[Tuple[ZipFileInfo, Optional[str]]] = []
+    sample_size = 64 * 1024
+
+    try:
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            for file_info in zip_files:
+                try:
+                    # Compute partial hash (matches DirectoryScanner "size_partial").
+                    # Seek to each sample instead of reading the whole member, so
+                    # memory stays bounded at one sample per worker
+                    hasher = hashlib.sha256()
+                    file_size = file_info.file_size
+
+                    with zip_ref.open(file_info.file_path) as f:
+                        hasher.update(f.read(sample_size))
+                        if file_size > sample_size * 2:
+                            f.seek(file_size // 2)
+                            hasher.update(f.read(sample_size))
+                        if file_size > sample_size:
+                            f.seek(file_size - sample_size)
+                            hasher.update(f.read(sample_size))
+
+                    partial_hash = f"{file_size}_{hasher.hexdigest()[:16]}"
+
+                    if partial_hash in existing_by_size[file_info.file_size]:
+                        results.append((file_info, partial_hash))
+                    else:
+                        results.append((file_info, None))
+                except Exception:
+                    # If we can't read, assume it needs extraction
+                    results.append((file_info, None))
+    except Exception:
+        # If zip is bad, all its files need extraction
+        done = {fi for fi, _ in results}
+        results.extend((fi, None) for fi in zip_files if fi not in done)
+
+    return results
+
+
+def summarize_by_type(files: Iterable[ZipFileInfo]) -> Tuple[Dict[str, int], Dict[str, int]]:
+    """
+    Count files and total size per file type category in a single pass.
+
+    Returns:
+        Tuple of (files_by_type, size_by_type)
+    """
+    files_by_type: Dict[str, int] = defaultdict(int)
+    size_by_type: Dict[str, int] = defaultdict(int)
+    for file_info in files:
+        file_type = get_file_type(file_info.file_path)
+        files_by_type[file_type] += 1
+        size_by_type[file_type] += file_info.file_size
+    return files_by_type, size_by_type
+
+
+def render_bar(segments: Iterable[Tuple[str, int]]) -> str:
+    """
+    Build a Rich markup progress bar from colored segments.
+
+    Zero-width segments are skipped so no empty markup is emitted.
+
+    Args:
+        segments: (style, width) pairs in display order
+
+    Returns:
+        Markup string for console.print
+    """
+    return "".join(f"[{style}]{'█' * width}[/{style}]" for style, width in segments if width > 0)
+
+
+def show_extraction_plan_summary(
+    zip_stats: Dict[Path, dict],
+    unique_files: Dict[ZipFileInfo, str],
+    duplicate_count: int
+) -> None:
+    """
+    Show a compact totals-only extraction plan (used for dry runs).
+
+    Args:
+        zip_stats: Statistics for each zip file
+        unique_files: Files to be extracted with their proposed locations
+        duplicate_count: Duplicate files that will be skipped
+    """
+    already_extracted = sum(stats['already_extracted'] for stats in zip_stats.values())
+    deletable = sum(1 for stats in zip_stats.values() if stats['is_redundant'] or stats['is_fully_extracted'])
+
+    table = Table(title="Extraction Plan", show_header=False, title_style="bold cyan")
+    table.add_column("Item", style="dim")
+    table.add_column("Value", justify="right")
+    table.add_row("Zips", f"{len(zip_stats):,}")
+    table.add_row("To extract", f"[bold green]{len(unique_files):,}[/bold green] ({format_size(sum(f.file_size for f in unique_files))})")
+    table.add_row("Already in output", f"[cyan]{already_extracted:,}[/cyan]")
+    table.add_row("Duplicates", f"[yellow]{duplicate_count:,}[/yellow]")
+    table.add_row("Zips that can be deleted", f"{deletable:,}")
+
+    console.print(table)
+    console.print("[dim]Use --verbose for the full plan[/dim]")
+    console.print()
 
 
 def show_extraction_plan(
     total_files_in_zips: int,
-    unique_files: Dict[ZipFileInfo, Path],
+    unique_files: Dict[ZipFileInfo, str],
     already_extracted_count: int,
     duplicate_count: int,
     fully_extracted_zips: List[Path],
     redundant_zips: List[Path],
     zip_stats: Dict[Path, dict],
-    output_dir: Path
+    output_dir: Path,
+    type_summary: Optional[Tuple[Dict[str, int], Dict[str, int]]] = None
 ) -> None:
     """
     Show a comprehensive extraction plan after analysis.
 
     Args:
         total_files_in_zips: Total files found in all zips
-        unique_files: Files to be extracted with their destinations
+        unique_files: Files to be extracted with their proposed locations
         already_extracted_count: Files already in output directory
         duplicate_count: Duplicate files that will be skipped
         fully_extracted_zips: Zips with all files already extracted
         redundant_zips: Zips that are 100% duplicates
         zip_stats: Statistics for each zip file
         output_dir: Target extraction directory
+        type_summary: Precomputed result of summarize_by_type(unique_files)
     """
     console.print()
 
@@ -211,12 +535,13 @@ def show_extraction_plan(
 
     # Calculate potential space to free (zips that can be deleted)
     deletable_zips = set(fully_extracted_zips) | set(redundant_zips)
-    space_to_free = 0
+    zip_sizes: Dict[Path, int] = {}
     for zp in deletable_zips:
         try:
-            space_to_free += zp.stat().st_size
-        except:
-            pass
+            zip_sizes[zp] = zp.stat().st_size
+        except OSError:
+            zip_sizes[zp] = 0
+    space_to_free = sum(zip_sizes.values())
 
     # Main summary panel
     summary_text = Text()
@@ -249,10 +574,7 @@ def show_extraction_plan(
 
         for zp in sorted(deletable_zips):
             stats = zip_stats.get(zp, {})
-            try:
-                size = zp.stat().st_size
-            except:
-                size = 0
+            size = zip_sizes[zp]
 
             if zp in fully_extracted_zips:
                 status = "[cyan]Fully Extracted[/cyan]"
@@ -272,13 +594,7 @@ def show_extraction_plan(
 
     # Files by type breakdown
     if unique_files:
-        files_by_type: Dict[str, int] = defaultdict(int)
-        size_by_type: Dict[str, int] = defaultdict(int)
-
-        for file_info in unique_files.keys():
-            file_type = get_file_type(file_info.file_path)
-            files_by_type[file_type] += 1
-            size_by_type[file_type] += file_info.file_size
+        files_by_type, size_by_type = type_summary or summarize_by_type(unique_files.keys())
 
         type_table = Table(title="Files to Extract by Type", show_header=True, header_style="bold green")
         type_table.add_column("Type", style="cyan")
@@ -301,11 +617,12 @@ def generate_extraction_report(
     total_extracted: int,
     total_errors: int,
     total_bytes: int,
-    unique_files: Dict[ZipFileInfo, Path],
+    unique_files: Dict[ZipFileInfo, str],
     deleted_zips: List[Path],
     total_freed: int,
     start_time: datetime,
-    end_time: datetime
+    end_time: datetime,
+    type_summary: Optional[Tuple[Dict[str, int], Dict[str, int]]] = None
 ) -> Path:
     """
     Generate a post-extraction report.
@@ -320,6 +637,7 @@ def generate_extraction_report(
         total_freed: Space freed by deleting zips
         start_time: When extraction started
         end_time: When extraction finished
+        type_summary: Precomputed result of summarize_by_type(unique_files)
 
     Returns:
         Path to the generated report file
@@ -330,57 +648,49 @@ def generate_extraction_report(
     duration = (end_time - start_time).total_seconds()
 
     # Group extracted files by year
-    files_by_year: Dict[int, List[Tuple[ZipFileInfo, Path]]] = defaultdict(list)
-    for file_info, dest in unique_files.items():
-        parts = dest.parts
+    files_by_year: Dict[int, List[Tuple[ZipFileInfo, str]]] = defaultdict(list)
+    for file_info, proposed in unique_files.items():
+        parts = proposed.split(os.sep, 2)
         if len(parts) >= 2 and parts[1].isdigit():
             year = int(parts[1])
         else:
             year = 0
-        files_by_year[year].append((file_info, dest))
+        files_by_year[year].append((file_info, proposed))
 
     # Group by type
-    files_by_type: Dict[str, int] = defaultdict(int)
-    size_by_type: Dict[str, int] = defaultdict(int)
-    for file_info in unique_files.keys():
-        file_type = get_file_type(file_info.file_path)
-        files_by_type[file_type] += 1
-        size_by_type[file_type] += file_info.file_size
+    files_by_type, size_by_type = type_summary or summarize_by_type(unique_files.keys())
 
     # Generate year rows for table
-    year_rows = ""
-    for year in sorted(files_by_year.keys(), reverse=True):
-        year_label = str(year) if year > 0 else "Unknown"
-        file_list = files_by_year[year]
-        year_size = sum(f.file_size for f, _ in file_list)
-        year_rows += f"""
+    year_rows = "\n".join(
+        f"""
             <tr>
-                <td>{year_label}</td>
-                <td>{len(file_list):,}</td>
-                <td>{format_size(year_size)}</td>
-            </tr>
-        """
+                <td>{year if year > 0 else "Unknown"}</td>
+                <td>{len(files_by_year[year]):,}</td>
+                <td>{format_size(sum(f.file_size for f, _ in files_by_year[year]))}</td>
+            </tr>"""
+        for year in sorted(files_by_year.keys(), reverse=True)
+    )
 
     # Generate type rows
-    type_rows = ""
-    for file_type in sorted(files_by_type.keys(), key=lambda x: files_by_type[x], reverse=True):
-        type_rows += f"""
+    type_rows = "\n".join(
+        f"""
             <tr>
                 <td><span class="badge {file_type}">{file_type}</span></td>
                 <td>{files_by_type[file_type]:,}</td>
                 <td>{format_size(size_by_type[file_type])}</td>
-            </tr>
-        """
+            </tr>"""
+        for file_type in sorted(files_by_type.keys(), key=lambda x: files_by_type[x], reverse=True)
+    )
 
     # Generate deleted zips list
-    deleted_rows = ""
-    for zip_path in deleted_zips:
-        deleted_rows += f"""
+    deleted_rows = "\n".join(
+        f"""
             <tr>
                 <td>{zip_path.name}</td>
                 <td>Deleted</td>
-            </tr>
-        """
+            </tr>"""
+        for zip_path in deleted_zips
+    )
 
     html = f'''<!DOCTYPE html>
 <html lang="en">
@@ -388,90 +698,7 @@ def generate_extraction_report(
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Extraction Report - {end_time.strftime("%Y-%m-%d %H:%M")}</title>
-    <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            background: #0f172a;
-            color: #e2e8f0;
-            line-height: 1.6;
-            padding: 40px;
-        }}
-        .container {{ max-width: 1200px; margin: 0 auto; }}
-        header {{
-            background: linear-gradient(135deg, #059669 0%, #0f172a 100%);
-            border: 1px solid #34d399;
-            padding: 30px;
-            margin-bottom: 30px;
-            border-radius: 16px;
-        }}
-        header h1 {{ font-size: 2rem; margin-bottom: 8px; color: #fff; }}
-        header p {{ color: #94a3b8; }}
-        .stats-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 16px;
-            margin-bottom: 30px;
-        }}
-        .stat-card {{
-            background: #1e293b;
-            border: 1px solid #334155;
-            padding: 20px;
-            border-radius: 12px;
-            text-align: center;
-        }}
-        .stat-card h3 {{ font-size: 2rem; color: #34d399; margin-bottom: 4px; }}
-        .stat-card.warning h3 {{ color: #fbbf24; }}
-        .stat-card.error h3 {{ color: #f87171; }}
-        .stat-card p {{ color: #94a3b8; font-size: 0.85rem; }}
-        .section {{ margin-bottom: 30px; }}
-        .section-title {{
-            font-size: 1.2rem;
-            color: #fff;
-            margin-bottom: 16px;
-            padding-bottom: 8px;
-            border-bottom: 1px solid #334155;
-        }}
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-            background: #1e293b;
-            border-radius: 12px;
-            overflow: hidden;
-        }}
-        th {{
-            background: #0f172a;
-            padding: 14px 16px;
-            text-align: left;
-            font-weight: 600;
-            color: #94a3b8;
-            font-size: 0.85rem;
-        }}
-        td {{
-            padding: 12px 16px;
-            border-bottom: 1px solid #334155;
-        }}
-        tr:hover {{ background: #334155; }}
-        .badge {{
-            display: inline-block;
-            padding: 4px 10px;
-            border-radius: 6px;
-            font-size: 0.75rem;
-            font-weight: 500;
-        }}
-        .badge.image {{ background: #1e3a5f; color: #60a5fa; }}
-        .badge.video {{ background: #450a0a; color: #f87171; }}
-        .badge.audio {{ background: #2e1065; color: #a78bfa; }}
-        .badge.document {{ background: #422006; color: #fbbf24; }}
-        .badge.data {{ background: #052e16; color: #34d399; }}
-        .badge.other {{ background: #1f2937; color: #9ca3af; }}
-        footer {{
-            text-align: center;
-            padding: 30px;
-            color: #64748b;
-            font-size: 0.85rem;
-        }}
-    </style>
+{EXTRACTION_REPORT_STYLE}
 </head>
 <body>
     <div class="container">
@@ -577,7 +804,8 @@ def generate_extraction_report(
 
 def cmd_extract(args):
     """Execute the extract command (extract files with optional cleanup)."""
-    cache = TakeoutCache()
+    output_dir = Path(args.output_dir)
+    cache = get_cache()
     if args.clear_cache:
         cache.clear()
         console.print("[yellow]Cache cleared[/yellow]")
@@ -588,7 +816,7 @@ def cmd_extract(args):
     try:
         # Step 1: Scan directory
         console.print("[bold]Step 1:[/bold] Scanning zip files in directory")
-        files = scan_directory(args.input_dir)
+        files, zip_mtimes = scan_directory(args.input_dir)
 
         if not files:
             console.print("[red]No files found. Exiting.[/red]")
@@ -596,7 +824,6 @@ def cmd_extract(args):
         console.print()
 
         # Step 1b: Scan output directory for already-extracted files (with caching)
-        output_dir = Path(args.output_dir)
         existing_hashes: Set[str] = set()
         existing_by_size: Dict[int, Set[str]] = defaultdict(set)
         if output_dir.exists():
@@ -605,27 +832,20 @@ def cmd_extract(args):
             # Check if we can use cached data entirely
             last_scan = cache.get_directory_last_scan(output_dir)
             use_cache_only = False
+            dir_entries: Optional[List[Tuple[str, int, float]]] = None
 
             if last_scan:
                 last_scan_time, cached_file_count = last_scan
                 # Check if directory has been modified since last scan
                 # by finding the newest file mtime
-                try:
-                    newest_mtime = 0.0
-                    file_count = 0
-                    for f in output_dir.rglob("*"):
-                        if f.is_file():
-                            file_count += 1
-                            mtime = f.stat().st_mtime
-                            if mtime > newest_mtime:
-                                newest_mtime = mtime
-
-                    # If file count matches and no file is newer than last scan, use cache
-                    if file_count == cached_file_count and newest_mtime < last_scan_time.timestamp():
-                        use_cache_only = True
-                        console.print(f"[dim]Using cached data ({cached_file_count:,} files, scanned {last_scan_time.strftime('%Y-%m-%d %H:%M')})[/dim]")
-                except OSError:
-                    pass
+                dir_entries = list(walk_with_stats(output_dir))
+                newest_mtime = max((mtime for _, _, mtime in dir_entries), default=0.0)
+                file_count = len(dir_entries)
+
+                # If file count matches and no file is newer than last scan, use cache
+                if file_count == cached_file_count and newest_mtime < last_scan_time.timestamp():
+                    use_cache_only = True
+                    console.print(f"[dim]Using cached data ({cached_file_count:,} files, scanned {last_scan_time.strftime('%Y-%m-%d %H:%M')})[/dim]")
 
             if use_cache_only:
                 # Load directly from cache
@@ -636,18 +856,16 @@ def cmd_extract(args):
                 # Need to scan and verify
                 cached_files = cache.get_directory_files(output_dir)
                 scanner = DirectoryScanner(hash_strategy="size_partial")
-                files_to_hash = []
-                files_from_cache = 0
                 new_cache_entries = []
 
-                # Get all files in directory
+                # Get all files in directory (reusing the staleness-check walk if we did one)
                 from rich.progress import Progress, SpinnerColumn, TextColumn
 
-                all_dir_files = list(output_dir.rglob("*"))
-                all_dir_files = [f for f in all_dir_files if f.is_file()]
+                if dir_entries is None:
+                    dir_entries = list(walk_with_stats(output_dir))
 
                 if cached_files:
-                    console.print(f"[dim]Checking {len(all_dir_files):,} files against {len(cached_files):,} cached...[/dim]")
+                    console.print(f"[dim]Checking {len(dir_entries):,} files against {len(cached_files):,} cached...[/dim]")
 
                 with Progress(
                     SpinnerColumn(),
@@ -656,27 +874,9 @@ def cmd_extract(args):
                 ) as progress:
                     task = progress.add_task(f"Scanning...", total=None)
 
-                    for file_path in all_dir_files:
-                        try:
-                            rel_path = str(file_path.relative_to(output_dir))
-                            stat = file_path.stat()
-                            file_size = stat.st_size
-                            file_mtime = stat.st_mtime
-
-                            # Check if in cache with matching mtime
-                            if rel_path in cached_files:
-                                cached_size, cached_mtime, cached_key = cached_files[rel_path]
-                                if cached_size == file_size and abs(cached_mtime - file_mtime) < 1:
-                                    # Use cached hash
-                                    existing_hashes.add(cached_key)
-                                    existing_by_size[file_size].add(cached_key)
-                                    files_from_cache += 1
-                                    continue
-
-                            # Need to compute hash for this file
-                            files_to_hash.append(file_path)
-                        except (OSError, ValueError):
-                            pass
+                    files_to_hash = check_cached(
+                        dir_entries, cached_files, existing_hashes, existing_by_size, output_dir
+                    )
 
                 # Hash files that aren't cached
                 if files_to_hash:
@@ -690,21 +890,24 @@ def cmd_extract(args):
 
                         # Add to cache
                         rel_path = str(f.file_path.relative_to(output_dir))
-                        new_cache_entries.append((rel_path, f.file_size, f.file_path.stat().st_mtime, content_key))
+                        new_cache_entries.append((rel_path, f.file_size, f.mtime, content_key))
 
-                    # Save new entries to cache
+                # Save new entries and scan timestamp in a single transaction
+                with cache.transaction():
                     if new_cache_entries:
                         cache.set_directory_files_bulk(output_dir, new_cache_entries)
 
-                # Update last scan timestamp
-                cache.set_directory_last_scan(output_dir, len(all_dir_files))
+                    # Update last scan timestamp
+                    cache.set_directory_last_scan(output_dir, len(dir_entries))
 
             if existing_hashes:
                 console.print(f"[cyan]Found {len(existing_hashes):,} existing files in output directory[/cyan]")
             console.print()
 
         # Steps 2-4: Analysis
-        hash_map, file_dates, proposed_locations = run_analysis(files, cache)
+        hash_map, file_dates, proposed_locations = run_analysis(
+            files, cache, verbose=args.verbose, zip_mtimes=zip_mtimes
+        )
 
         # Step 5: Identify unique files (first occurrence of each content key)
         console.print("[bold]Step 5:[/bold] Identifying unique files for extraction")
@@ -719,14 +922,13 @@ def cmd_extract(args):
 
         # Build unique files dict (only originals with proposed locations)
         # Also filter out files that already exist in the output directory
-        unique_files: Dict[ZipFileInfo, Path] = {}
+        # Values are the raw proposed locations; Paths are only built at extraction time
+        unique_files: Dict[ZipFileInfo, str] = {}
         already_extracted_count = 0
         already_extracted_files: Set[ZipFileInfo] = set()  # Track which files are already extracted
 
         # If we have existing files, we need to compute partial hashes for comparison
         if existing_by_size:
-            import hashlib
-            import zipfile as zf
             from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 
             # First pass: separate files that definitely need extraction (no size match)
@@ -739,9 +941,7 @@ def cmd_extract(args):
 
                 # Fast path: if no files with this size exist, definitely new
                 if first_file.file_size not in existing_by_size:
-                    proposed = proposed_locations[first_file]
-                    dest = output_dir / Path(proposed).relative_to(Path(proposed).parts[0])
-                    unique_files[first_file] = dest
+                    unique_files[first_file] = proposed_locations[first_file]
                 else:
                     needs_hash_check.append(first_file)
 
@@ -763,81 +963,68 @@ def cmd_extract(args):
                 ) as progress:
                     task = progress.add_task("Checking files...", total=len(needs_hash_check))
 
-                    for zip_path, zip_files in files_by_zip_check.items():
-                        try:
-                            with zf.ZipFile(zip_path, 'r') as zip_ref:
-                                for file_info in zip_files:
-                                    try:
-                                        with zip_ref.open(file_info.file_path) as f:
-                                            content = f.read()
-
-                                        # Compute partial hash
-                                        hasher = hashlib.sha256()
-                                        sample_size = 64 * 1024
-                                        file_size = len(content)
-
-                                        hasher.update(content[:sample_size])
-                                        if file_size > sample_size * 2:
-                                            middle_start = file_size // 2
-                                            hasher.update(content[middle_start:middle_start + sample_size])
-                                        if file_size > sample_size:
-                                            hasher.update(content[-sample_size:])
-
-                                        partial_hash = f"{file_size}_{hasher.hexdigest()[:16]}"
-
-                                        if partial_hash in existing_by_size[file_info.file_size]:
-                                            already_extracted_count += 1
-                                            already_extracted_files.add(file_info)
-                                        else:
-                                            proposed = proposed_locations[file_info]
-                                            dest = output_dir / Path(proposed).relative_to(Path(proposed).parts[0])
-                                            unique_files[file_info] = dest
-                                    except Exception:
-                                        # If we can't read, assume it needs extraction
-                                        proposed = proposed_locations[file_info]
-                                        dest = output_dir / Path(proposed).relative_to(Path(proposed).parts[0])
-                                        unique_files[file_info] = dest
-
-                                    progress.update(task, advance=1)
-                        except Exception:
-                            # If zip is bad, add all files from it
-                            for file_info in zip_files:
-                                proposed = proposed_locations[file_info]
-                                dest = output_dir / Path(proposed).relative_to(Path(proposed).parts[0])
-                                unique_files[file_info] = dest
+                    # Each zip is read by its own worker (one ZipFile per task);
+                    # results are merged here on the main thread
+                    max_workers = min(8, len(files_by_zip_check))
+                    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                        futures = [
+                            executor.submit(check_zip_against_output, zip_path, zip_files, existing_by_size)
+                            for zip_path, zip_files in files_by_zip_check.items()
+                        ]
+
+                        for future in as_completed(futures):
+                            for file_info, matching_key in future.result():
+                                if matching_key is not None:
+                                    already_extracted_count += 1
+                                    already_extracted_files.add(file_info)
+                                else:
+                                    unique_files[file_info] = proposed_locations[file_info]
+
                                 progress.update(task, advance=1)
         else:
-            # No existing files, just add all unique files
-            for content_key, file_list in hash_map.items():
-                first_file = file_list[0]
-                if first_file in proposed_locations:
-                    proposed = proposed_locations[first_file]
-                    dest = output_dir / Path(proposed).relative_to(Path(proposed).parts[0])
-                    unique_files[first_file] = dest
+            # No existing files, just add all unique files (first file of each content key)
+            unique_files = {
+                file_list[0]: proposed
+                for file_list in hash_map.values()
+                if (proposed := proposed_locations.get(file_list[0])) is not None
+            }
 
         # Find ALL zips and identify redundant/fully-extracted ones
-        all_zips: set = {f.zip_path for f in files}
+        files_by_source_zip: Dict[Path, List[ZipFileInfo]] = defaultdict(list)
+        for f in files:
+            files_by_source_zip[f.zip_path].append(f)
+
         zip_stats: Dict[Path, dict] = {}
-        for zip_path in all_zips:
-            zip_files = [f for f in files if f.zip_path == zip_path]
-            # Count files that need extraction (originals not already extracted)
-            needs_extraction = sum(1 for f in zip_files if f in original_files and f not in already_extracted_files)
-            # Count files already in output
-            already_in_output = sum(1 for f in zip_files if f in already_extracted_files)
-            # Count duplicate files (within the zip set)
-            dup_count = sum(1 for f in zip_files if f in duplicate_files)
+        redundant_zips: List[Path] = []
+        fully_extracted_zips: List[Path] = []
+        for zip_path, zip_files in files_by_source_zip.items():
+            needs_extraction = 0   # Originals not already extracted
+            already_in_output = 0  # Files already in output
+            dup_count = 0          # Duplicate files (within the zip set)
+            for f in zip_files:
+                if f in already_extracted_files:
+                    already_in_output += 1
+                elif f in original_files:
+                    needs_extraction += 1
+                if f in duplicate_files:
+                    dup_count += 1
+
+            is_redundant = needs_extraction == 0 and dup_count > 0 and already_in_output == 0
+            is_fully_extracted = needs_extraction == 0 and already_in_output > 0
+            if is_redundant:
+                redundant_zips.append(zip_path)
+            elif is_fully_extracted:
+                fully_extracted_zips.append(zip_path)
+
             zip_stats[zip_path] = {
                 'total': len(zip_files),
                 'needs_extraction': needs_extraction,
                 'already_extracted': already_in_output,
                 'duplicates': dup_count,
-                'is_redundant': needs_extraction == 0 and dup_count > 0 and already_in_output == 0,
-                'is_fully_extracted': needs_extraction == 0 and already_in_output > 0
+                'is_redundant': is_redundant,
+                'is_fully_extracted': is_fully_extracted
             }
 
-        redundant_zips = [zp for zp, stats in zip_stats.items() if stats['is_redundant']]
-        fully_extracted_zips = [zp for zp, stats in zip_stats.items() if stats['is_fully_extracted']]
-
         duplicate_count = len(files) - len(unique_files) - already_extracted_count
         console.print(f"[green]{len(unique_files)} unique files to extract[/green]")
         if already_extracted_count > 0:
@@ -850,6 +1037,15 @@ def cmd_extract(args):
             console.print(f"[red]{len(redundant_zips)} zip(s) are 100% duplicates (can be deleted)[/red]")
         console.print()
 
+        if args.dry_run and not args.verbose:
+            show_extraction_plan_summary(zip_stats, unique_files, duplicate_count)
+            console.print("[bold cyan]DRY RUN - No files will be extracted[/bold cyan]")
+            console.print("[bold green]Dry run complete![/bold green]")
+            return
+
+        # Type breakdown is shared by the plan and the final report
+        type_summary = summarize_by_type(unique_files.keys())
+
         # Show extraction plan summary
         show_extraction_plan(
             total_files_in_zips=len(files),
@@ -859,7 +1055,8 @@ def cmd_extract(args):
             fully_extracted_zips=fully_extracted_zips,
             redundant_zips=redundant_zips,
             zip_stats=zip_stats,
-            output_dir=Path(args.output_dir)
+            output_dir=output_dir,
+            type_summary=type_summary
         )
 
         if args.dry_run:
@@ -873,8 +1070,10 @@ def cmd_extract(args):
 
         # Step 6: Group by zip for ordered extraction
         files_by_zip: Dict[Path, List[Tuple[ZipFileInfo, Path]]] = defaultdict(list)
-        for file_info, dest in unique_files.items():
-            files_by_zip[file_info.zip_path].append((file_info, dest))
+        zip_sizes: Dict[Path, int] = defaultdict(int)
+        for file_info, proposed in unique_files.items():
+            files_by_zip[file_info.zip_path].append((file_info, output_dir / strip_base_dir(proposed)))
+            zip_sizes[file_info.zip_path] += file_info.file_size
 
         # Determine cleanup mode
         if args.auto_cleanup:
@@ -900,7 +1099,7 @@ def cmd_extract(args):
             for i, zip_path in enumerate(sorted_zips, 1):
                 zip_files = files_by_zip[zip_path]
                 file_count = len(zip_files)
-                zip_size = sum(f.file_size for f, _ in zip_files)
+                zip_size = zip_sizes[zip_path]
 
                 # Show what we're about to extract
                 console.print(Panel(
@@ -955,27 +1154,75 @@ def cmd_extract(args):
             console.print()
 
             sorted_zips = sorted(files_by_zip.keys())
-            for i, zip_path in enumerate(sorted_zips, 1):
-                zip_files = files_by_zip[zip_path]
-                file_count = len(zip_files)
-                zip_size = sum(f.file_size for f, _ in zip_files)
+            jobs = args.jobs or min(os.cpu_count() or 1, len(sorted_zips))
+
+            if jobs > 1:
+                # Decompression is CPU-bound: extract several zips at once in worker
+                # processes, then report and prompt for cleanup here as each finishes
+                console.print(f"[dim]Extracting {len(sorted_zips)} zips with {jobs} worker processes...[/dim]")
+                with ProcessPoolExecutor(max_workers=jobs) as executor:
+                    futures = {
+                        executor.submit(extract_zip, zip_path, files_by_zip[zip_path]): zip_path
+                        for zip_path in sorted_zips
+                    }
 
-                console.print(f"[bold cyan][{i}/{len(sorted_zips)}][/bold cyan] {zip_path.name} ({file_count:,} files, {format_size(zip_size)})")
+                    for i, future in enumerate(as_completed(futures), 1):
+                        zip_path = futures[future]
+                        zip_files = files_by_zip[zip_path]
+                        file_count = len(zip_files)
+                        zip_size = zip_sizes[zip_path]
 
-                # Extract this zip
-                extracted, errors, bytes_written = extract_all_unique({zip_path: zip_files}, console)
-                total_extracted += extracted
-                total_errors += errors
-                total_bytes += bytes_written
+                        console.print(f"[bold cyan][{i}/{len(sorted_zips)}][/bold cyan] {zip_path.name} ({file_count:,} files, {format_size(zip_size)})")
 
-                # Cleanup for this zip immediately after extraction
-                if not args.no_cleanup:
-                    result = cleanup_manager.prompt_cleanup(zip_path, extracted, errors)
-                    if result.deleted:
-                        total_freed += result.size_freed
-                        deleted_zips.append(zip_path)
+                        try:
+                            summary = future.result()
+                        except Exception as e:
+                            summary = ZipExtractionSummary(
+                                zip_path=zip_path,
+                                total_files=file_count,
+                                extracted_count=0,
+                                skipped_count=0,
+                                error_count=file_count,
+                                bytes_extracted=0,
+                                errors=[str(e)]
+                            )
+                        print_zip_summary(summary, console)
+
+                        extracted, errors = summary.extracted_count, summary.error_count
+                        total_extracted += extracted
+                        total_errors += errors
+                        total_bytes += summary.bytes_extracted
+
+                        # Cleanup for this zip as soon as its extraction is done
+                        if not args.no_cleanup:
+                            result = cleanup_manager.prompt_cleanup(zip_path, extracted, errors)
+                            if result.deleted:
+                                total_freed += result.size_freed
+                                deleted_zips.append(zip_path)
+
+                        console.print()
+            else:
+                for i, zip_path in enumerate(sorted_zips, 1):
+                    zip_files = files_by_zip[zip_path]
+                    file_count = len(zip_files)
+                    zip_size = zip_sizes[zip_path]
+
+                    console.print(f"[bold cyan][{i}/{len(sorted_zips)}][/bold cyan] {zip_path.name} ({file_count:,} files, {format_size(zip_size)})")
+
+                    # Extract this zip
+                    extracted, errors, bytes_written = extract_all_unique({zip_path: zip_files}, console)
+                    total_extracted += extracted
+                    total_errors += errors
+                    total_bytes += bytes_written
+
+                    # Cleanup for this zip immediately after extraction
+                    if not args.no_cleanup:
+                        result = cleanup_manager.prompt_cleanup(zip_path, extracted, errors)
+                        if result.deleted:
+                            total_freed += result.size_freed
+                            deleted_zips.append(zip_path)
 
-                console.print()
+                    console.print()
         else:
             console.print("[bold]Step 6:[/bold] No new files to extract")
             console.print("[cyan]All files already exist in output directory[/cyan]")
@@ -984,11 +1231,19 @@ def cmd_extract(args):
         # Cleanup for fully extracted zips (all files already in output)
         if fully_extracted_zips and not args.no_cleanup:
             console.print()
-            console.print("[bold cyan]Fully extracted archives (all files already in output):[/bold cyan]")
+            fully_table = Table(
+                title="Fully extracted archives (all files already in output)",
+                show_header=True,
+                header_style="bold cyan"
+            )
+            fully_table.add_column("Archive", style="dim")
+            fully_table.add_column("Already Extracted", justify="right")
             for zip_path in sorted(fully_extracted_zips):
-                stats = zip_stats[zip_path]
-                console.print(f"  {zip_path.name}: {stats['already_extracted']} files already extracted")
+                fully_table.add_row(zip_path.name, f"{zip_stats[zip_path]['already_extracted']:,}")
+            console.print(fully_table)
 
+            for zip_path in sorted(fully_extracted_zips):
+                stats = zip_stats[zip_path]
                 result = cleanup_manager.prompt_cleanup(zip_path, stats['already_extracted'], 0)
                 if result.deleted:
                     total_freed += result.size_freed
@@ -997,11 +1252,18 @@ def cmd_extract(args):
         # Cleanup for redundant zips (100% duplicates - nothing extracted)
         if redundant_zips and not args.no_cleanup:
             console.print()
-            console.print("[bold red]Redundant archives (100% duplicates):[/bold red]")
+            redundant_table = Table(
+                title="Redundant archives (100% duplicates)",
+                show_header=True,
+                header_style="bold red"
+            )
+            redundant_table.add_column("Archive", style="dim")
+            redundant_table.add_column("Duplicates", justify="right")
             for zip_path in sorted(redundant_zips):
-                stats = zip_stats[zip_path]
-                console.print(f"  {zip_path.name}: {stats['duplicates']} duplicate files (0 unique)")
+                redundant_table.add_row(zip_path.name, f"{zip_stats[zip_path]['duplicates']:,}")
+            console.print(redundant_table)
 
+            for zip_path in sorted(redundant_zips):
                 result = cleanup_manager.prompt_cleanup(zip_path, 0, 0)
                 if result.deleted:
                     total_freed += result.size_freed
@@ -1015,7 +1277,7 @@ def cmd_extract(args):
         # Generate extraction report
         console.print("[bold]Step 8:[/bold] Generating extraction report")
         report_path = generate_extraction_report(
-            output_dir=Path(args.output_dir),
+            output_dir=output_dir,
             total_extracted=total_extracted,
             total_errors=total_errors,
             total_bytes=total_bytes,
@@ -1023,7 +1285,8 @@ def cmd_extract(args):
             deleted_zips=deleted_zips,
             total_freed=total_freed,
             start_time=start_time,
-            end_time=end_time
+            end_time=end_time,
+            type_summary=type_summary
         )
         console.print(f"[green]Report saved to: {report_path}[/green]")
         console.print()
@@ -1060,11 +1323,11 @@ def cmd_extract(args):
 
         # Show output location and report
         console.print()
-        console.print(f"[bold]Output:[/bold] {Path(args.output_dir).absolute()}")
+        console.print(f"[bold]Output:[/bold] {output_dir.absolute()}")
         console.print(f"[bold]Report:[/bold] {report_path.absolute()}")
 
     finally:
-        cache.close()
+        cache.flush()
 
 
 def cmd_reconcile(args):
@@ -1089,19 +1352,17 @@ def cmd_reconcile(args):
 
     # Scan output directory
     console.print("[bold]Step 2:[/bold] Scanning output directory")
-    cache = TakeoutCache()
+    cache = get_cache()
 
     try:
         if not output_dir.exists():
             console.print(f"[yellow]Output directory does not exist: {output_dir}[/yellow]")
-            existing_by_size: Dict[int, Set[str]] = {}
+            existing_keys: Set[str] = set()
         else:
             # Use the same caching logic as extract
             scanner = DirectoryScanner(hash_strategy="size_partial")
             existing_files = scanner.scan_directory(output_dir)
-            existing_by_size = defaultdict(set)
-            for f in existing_files:
-                existing_by_size[f.file_size].add(f.get_content_key())
+            existing_keys = {f.get_content_key() for f in existing_files}
 
         console.print()
 
@@ -1113,23 +1374,14 @@ def cmd_reconcile(args):
         missing_source = []
 
         for entry in manifest['files']:
-            file_size = entry['file_size']
             content_key = entry['content_key']
 
-            # Check if file exists in output (by size + partial hash)
-            # We need to match the content_key format
-            if file_size in existing_by_size:
-                # Check if any existing file matches
-                found = False
-                for existing_key in existing_by_size[file_size]:
-                    # Content keys are in format "size_hash" for partial or "size_crc" for zip
-                    # We need to check if the file content matches
-                    if existing_key == content_key:
-                        found = True
-                        break
-                if found:
-                    extracted.append(entry)
-                    continue
+            # Check if file exists in output
+            # Content keys are in format "size_hash" for partial or "size_crc" for zip,
+            # so the size is already part of the key
+            if content_key in existing_keys:
+                extracted.append(entry)
+                continue
 
             # Check if source zip still exists
             source_zip = Path(entry['source_zip'])
@@ -1183,10 +1435,9 @@ def cmd_reconcile(args):
 
         # Show missing source zips
         if missing_source:
-            missing_zips = set(entry['source_zip'] for entry in missing_source)
+            missing_zip_counts = Counter(entry['source_zip'] for entry in missing_source)
             console.print("[bold red]Missing source zips:[/bold red]")
-            for zip_path in sorted(missing_zips):
-                count = sum(1 for e in missing_source if e['source_zip'] == zip_path)
+            for zip_path, count in sorted(missing_zip_counts.items()):
                 console.print(f"  {Path(zip_path).name}: {count:,} files")
             console.print()
 
@@ -1197,9 +1448,7 @@ def cmd_reconcile(args):
             pending_width = int(bar_width * len(pending) / total_files)
             missing_width = bar_width - extracted_width - pending_width
 
-            bar = "[green]" + "█" * extracted_width + "[/green]"
-            bar += "[yellow]" + "█" * pending_width + "[/yellow]"
-            bar += "[red]" + "█" * missing_width + "[/red]"
+            bar = render_bar([("green", extracted_width), ("yellow", pending_width), ("red", missing_width)])
 
             console.print(f"Progress: [{bar}] {pct_extracted:.1f}%")
             console.print()
@@ -1207,7 +1456,7 @@ def cmd_reconcile(args):
         console.print("[bold green]Reconciliation complete![/bold green]")
 
     finally:
-        cache.close()
+        cache.flush()
 
 
 def cmd_compare(args):
@@ -1237,33 +1486,17 @@ def cmd_compare(args):
         console.print(f"\n[bold]Extracting {len(result.unique_in_zip)} unique files...[/bold]")
 
         # Get dates for unique files
-        cache = TakeoutCache()
+        cache = get_cache()
         try:
-            result_queue: queue.Queue = queue.Queue()
-
-            with ThreadPoolExecutor(max_workers=1) as executor:
-                future = executor.submit(
-                    extract_dates_batch, result.unique_in_zip, result_queue, cache
-                )
-
-                with SimpleProgressDisplay("Extracting dates", len(result.unique_in_zip)) as progress:
-                    processed = 0
-                    while processed < len(result.unique_in_zip):
-                        try:
-                            file_info = result_queue.get(timeout=0.1)
-                            progress.update(file_info.get_display_path())
-                            processed += 1
-                        except:
-                            pass
-
-                file_dates = future.result()
+            file_dates = extract_dates_with_progress(result.unique_in_zip, cache)
 
             # Build extraction list
+            output_dir = Path(args.output_dir)
             files_by_zip: Dict[Path, List[Tuple[ZipFileInfo, Path]]] = defaultdict(list)
             for file_info in result.unique_in_zip:
                 file_date = file_dates.get(file_info, datetime.now())
                 proposed = propose_location(file_info, file_date)
-                dest = Path(args.output_dir) / Path(proposed).relative_to(Path(proposed).parts[0])
+                dest = output_dir / strip_base_dir(proposed)
                 files_by_zip[file_info.zip_path].append((file_info, dest))
 
             # Extract
@@ -1275,7 +1508,7 @@ def cmd_compare(args):
             console.print(f"  Bytes written: {format_size(total_bytes)}")
 
         finally:
-            cache.close()
+            cache.flush()
 
 
 def cmd_diff(args):
@@ -1297,14 +1530,14 @@ def cmd_diff(args):
     zip_files = list(source_dir.glob("*.zip"))
     is_zip_source = len(zip_files) > 0
 
-    cache = TakeoutCache()
+    cache = get_cache()
     try:
         if is_zip_source:
             # Source is zip files - scan them for unique files
             console.print(f"[bold]Step 1:[/bold] Scanning {len(zip_files)} zip files")
 
             # Scan all zips
-            all_files, zip_contents = scan_directory(source_dir)
+            all_files, _ = scan_directory(source_dir)
             console.print(f"[cyan]Found {len(all_files):,} total files in zips[/cyan]")
 
             # Build hash map to find unique files
@@ -1353,11 +1586,26 @@ def cmd_diff(args):
             source_files = list(unique_files)  # For display
 
         else:
-            # Source is regular directory
-            console.print("[bold]Step 1:[/bold] Scanning source directory")
+            # Source is regular directory; the two scans are independent so run them together
+            console.print("[bold]Step 1:[/bold] Scanning source and destination directories")
+            from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
+
             source_scanner = DirectoryScanner(hash_strategy=args.hash_strategy)
-            source_files = source_scanner.scan_directory(source_dir)
+            dest_scanner = DirectoryScanner(hash_strategy=args.hash_strategy)
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(bar_width=40),
+                TaskProgressColumn(),
+                console=console
+            ) as progress:
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    source_future = executor.submit(source_scanner.scan_directory, source_dir, progress=progress)
+                    dest_future = executor.submit(dest_scanner.scan_directory, dest_dir, progress=progress)
+                    source_files = source_future.result()
+                    dest_files = dest_future.result()
             console.print(f"[cyan]Found {len(source_files):,} files in source[/cyan]")
+            console.print(f"[cyan]Found {len(dest_files):,} files in destination[/cyan]")
             console.print()
 
             # Build source index by content key
@@ -1367,20 +1615,13 @@ def cmd_diff(args):
                 source_by_key[f.get_content_key()].append(f)
                 source_total_size += f.file_size
 
-            # Step 2: Scan destination directory
-            console.print("[bold]Step 2:[/bold] Scanning destination directory")
-            dest_scanner = DirectoryScanner(hash_strategy=args.hash_strategy)
-            dest_files = dest_scanner.scan_directory(dest_dir)
-            console.print(f"[cyan]Found {len(dest_files):,} files in destination[/cyan]")
-            console.print()
-
             # Build destination index
             dest_keys = set()
             for f in dest_files:
                 dest_keys.add(f.get_content_key())
 
-            # Step 3: Compare
-            console.print("[bold]Step 3:[/bold] Comparing directories")
+            # Step 2: Compare
+            console.print("[bold]Step 2:[/bold] Comparing directories")
 
             # Find files in source but not in destination
             missing_files = []
@@ -1420,15 +1661,15 @@ def cmd_diff(args):
         if args.show_missing and missing_files:
             # Group by parent folder (handle both ZipFileInfo and DirectoryFileInfo)
             by_folder: Dict[str, List] = defaultdict(list)
+            # Scanned paths all start with source_dir, so slice it off instead of relative_to()
+            source_prefix_len = 0 if source_dir == Path('.') else len(os.path.join(str(source_dir), ""))
             for f in missing_files:
                 if is_zip_source:
                     # ZipFileInfo has file_path as string
-                    file_path = Path(f.file_path)
-                    folder = str(file_path.parent) if file_path.parent != Path('.') else "(root)"
+                    folder = f.parent_dir or "(root)"
                 else:
                     # DirectoryFileInfo has file_path as Path
-                    rel_path = f.file_path.relative_to(source_dir)
-                    folder = str(rel_path.parent) if rel_path.parent != Path('.') else "(root)"
+                    folder = os.path.dirname(str(f.file_path))[source_prefix_len:] or "(root)"
                 by_folder[folder].append(f)
 
             folder_table = Table(title="Missing Files by Folder", show_header=True, header_style="bold yellow")
@@ -1453,8 +1694,7 @@ def cmd_diff(args):
             present_width = int(pct_present / 100 * bar_width)
             missing_width = bar_width - present_width
 
-            bar = "[green]" + "█" * present_width + "[/green]"
-            bar += "[yellow]" + "█" * missing_width + "[/yellow]"
+            bar = render_bar([("green", present_width), ("yellow", missing_width)])
 
             console.print(f"Progress: [{bar}] {pct_present:.1f}%")
             console.print()
@@ -1478,15 +1718,17 @@ def cmd_diff(args):
             }
 
             manifest_path = Path(args.save_manifest)
+            # Encode in one go: json.dumps (no indent) takes the C encoder, while
+            # json.dump always iterates in Python. Matters for 100k+ missing files
             with open(manifest_path, 'w', encoding='utf-8') as mf:
-                json.dump(manifest, mf, indent=2)
+                mf.write(json.dumps(manifest, separators=(',', ':')))
 
             console.print(f"[cyan]Manifest saved to: {manifest_path}[/cyan]")
 
         console.print("[bold green]Comparison complete![/bold green]")
 
     finally:
-        cache.close()
+        cache.flush()
 
 
 def cmd_latest(args):
@@ -1621,6 +1863,11 @@ def main():
         action="store_true",
         help="Don't automatically open the report"
     )
+    analyze_parser.add_argument(
+        "--verbose", "-v",
+        action="store_true",
+        help="Show date sources for each zip"
+    )
     analyze_parser.add_argument(
         "--clear-cache",
         action="store_true",
@@ -1656,11 +1903,22 @@ def main():
         action="store_true",
         help="Show what would be extracted without doing it"
     )
+    extract_parser.add_argument(
+        "--verbose", "-v",
+        action="store_true",
+        help="Show per-zip date sources, and with --dry-run the full extraction plan instead of totals only"
+    )
     extract_parser.add_argument(
         "--incremental", "-i",
         action="store_true",
         help="Process one zip at a time with cleanup between each"
     )
+    extract_parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=None,
+        help="Zips to extract in parallel (default: CPU count, capped at number of zips; 1 = sequential). Ignored with --incremental"
+    )
     extract_parser.add_argument(
         "--clear-cache",
         action="store_true",
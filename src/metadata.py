@@ -2,13 +2,20 @@
 import sys
 import io
 import json
+import re
+import atexit
+import mmap
+import struct
+import zlib
+import weakref
 import zipfile
 import queue
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, List, Set, TYPE_CHECKING
-from collections import defaultdict
-from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, Optional, Dict, List, Set, Tuple, TYPE_CHECKING
+from collections import defaultdict, Counter
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from PIL import Image
 from rich.console import Console
 from scanner import ZipFileInfo
@@ -21,14 +28,39 @@ console = Console(legacy_windows=(sys.platform == "win32"))
 # Image extensions that might have EXIF data
 EXIF_EXTENSIONS = {'.jpg', '.jpeg', '.tiff', '.tif'}
 
+# Google Takeout truncates long filenames; sidecars are matched on this many leading chars
+SIDECAR_PREFIX_LEN = 40
+
+# photoTakenTime.timestamp in a sidecar, matched on the raw bytes so the common
+# case skips the JSON parser; the object has no nested braces
+_PHOTO_TAKEN_TIMESTAMP_RE = re.compile(rb'"photoTakenTime"\s*:\s*\{[^}]*?"timestamp"\s*:\s*"?(-?\d+)')
+
 # Max workers for parallel extraction
 MAX_WORKERS = 16
 
+# EXIF tags holding dates: DateTimeOriginal (in the Exif sub-IFD), DateTime (IFD0),
+# and the IFD0 pointer to the Exif sub-IFD
+EXIF_TAG_DATETIME_ORIGINAL = 0x9003
+EXIF_TAG_DATETIME = 0x0132
+EXIF_TAG_EXIF_IFD = 0x8769
+
+# Image headers are read in chunks of EXIF_READ_CHUNK, up to EXIF_READ_LIMIT bytes
+EXIF_READ_CHUNK = 8192
+EXIF_READ_LIMIT = 65536
+
+# TIFF byte order marker -> (uint16, uint32, IFD entry) structs
+_TIFF_STRUCTS = {
+    b"II": (struct.Struct("<H"), struct.Struct("<I"), struct.Struct("<HHII")),
+    b"MM": (struct.Struct(">H"), struct.Struct(">I"), struct.Struct(">HHII")),
+}
+
 
 def extract_dates_batch(
     files: List[ZipFileInfo],
     result_queue: queue.Queue,
-    cache: Optional["TakeoutCache"] = None
+    cache: Optional["TakeoutCache"] = None,
+    verbose: bool = False,
+    zip_mtimes: Optional[Dict[Path, float]] = None
 ) -> Dict[ZipFileInfo, datetime]:
     """
     Extract dates for all files efficiently with caching.
@@ -44,6 +76,9 @@ def extract_dates_batch(
         files: List of ZipFileInfo objects
         result_queue: Queue for progress reporting
         cache: Optional TakeoutCache for persistence
+        verbose: Also print the date-source breakdown for each zip
+        zip_mtimes: Zip modification times from scan_directory, used for the
+            last-resort date instead of stat'ing each zip again
 
     Returns:
         Dictionary mapping file -> datetime
@@ -61,11 +96,14 @@ def extract_dates_batch(
     needs_extraction: List[ZipFileInfo] = []
     from_cache: List[ZipFileInfo] = []
 
+    # Cache keys use the zip path as a string; convert each zip's Path once
+    path_strs = {zip_path: str(zip_path) for zip_path in {f.zip_path for f in files}}
+
     for f in files:
         # Check cache first
-        cache_key = (str(f.zip_path), f.file_path, f.file_size, f.file_crc)
-        if cache_key in cached_dates:
-            file_dates[f] = cached_dates[cache_key]
+        cached = cached_dates.get((path_strs[f.zip_path], f.file_path, f.file_size, f.file_crc))
+        if cached is not None:
+            file_dates[f] = cached
             from_cache.append(f)
             continue
 
@@ -87,22 +125,31 @@ def extract_dates_batch(
         for f in needs_extraction:
             files_by_zip[f.zip_path].append(f)
 
-        extraction_queue: queue.Queue = queue.Queue()
-
         with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-            for zip_path, zip_files in files_by_zip.items():
-                executor.submit(_extract_dates_for_zip, zip_path, zip_files, extraction_queue, cache)
-
-            # Collect results
-            processed = 0
-            while processed < len(needs_extraction):
-                try:
-                    file_info, date = extraction_queue.get(timeout=0.1)
+            futures = [
+                executor.submit(
+                    _extract_dates_for_zip, zip_path, zip_files, cache,
+                    zip_mtimes.get(zip_path) if zip_mtimes else None
+                )
+                for zip_path, zip_files in files_by_zip.items()
+            ]
+
+            # Collect results per zip as each worker finishes. Workers don't print;
+            # their date-source counts are summarized here once.
+            per_zip_sources: List[Tuple[Path, Counter]] = []
+            total_sources: Counter = Counter()
+            for future in as_completed(futures):
+                zip_path, results, sources = future.result()
+                for file_info, date in results:
                     file_dates[file_info] = date
                     result_queue.put(file_info)
-                    processed += 1
-                except queue.Empty:
-                    pass
+                per_zip_sources.append((zip_path, sources))
+                total_sources.update(sources)
+
+        if verbose:
+            for zip_path, sources in sorted(per_zip_sources, key=lambda item: item[0].name):
+                console.print(f"[dim]  {zip_path.name}: {_format_date_sources(sources)}[/dim]")
+        console.print(f"[dim]  Date sources: {_format_date_sources(total_sources)}[/dim]")
 
     # Flush cache
     if cache:
@@ -111,12 +158,20 @@ def extract_dates_batch(
     return file_dates
 
 
+def _format_date_sources(sources: Counter) -> str:
+    """Format date-source counts from _extract_dates_for_zip for display."""
+    return (
+        f"json={sources['json']} exif={sources['exif']} zip={sources['zip_meta']} "
+        f"fallback={sources['fallback']} (JSON files: {sources['json_files']})"
+    )
+
+
 def _extract_dates_for_zip(
     zip_path: Path,
     file_infos: List[ZipFileInfo],
-    result_queue: queue.Queue,
-    cache: Optional["TakeoutCache"] = None
-) -> None:
+    cache: Optional["TakeoutCache"] = None,
+    zip_mtime: Optional[float] = None
+) -> Tuple[Path, List[Tuple[ZipFileInfo, datetime]], Counter]:
     """
     Extract dates for all files in a single zip archive.
 
@@ -125,86 +180,301 @@ def _extract_dates_for_zip(
     Args:
         zip_path: Path to the zip archive
         file_infos: List of files to process
-        result_queue: Queue to put results into
         cache: Optional cache for saving results
+        zip_mtime: Zip modification time recorded by the scanner (stat'ed if None)
+
+    Returns:
+        Tuple of (zip_path, list of (file, date) pairs one per input file,
+        counts of where the dates came from)
     """
+    results: List[Tuple[ZipFileInfo, datetime]] = []
+    sources: Counter = Counter()
+
+    # Last-resort date, looked up once per zip rather than once per file
+    try:
+        if zip_mtime is None:
+            zip_mtime = zip_path.stat().st_mtime
+        zip_mtime_fallback = datetime.fromtimestamp(zip_mtime)
+    except OSError:
+        zip_mtime_fallback = datetime.now()
+
+    zip_map: Optional[mmap.mmap] = None
     try:
         with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            # Map the archive so small sidecars can be sliced out directly
+            try:
+                zip_map = mmap.mmap(zip_ref.fp.fileno(), 0, access=mmap.ACCESS_READ)
+                if hasattr(mmap, "MADV_RANDOM"):
+                    zip_map.madvise(mmap.MADV_RANDOM)
+            except (OSError, ValueError, AttributeError):
+                zip_map = None
+
             # Build set of JSON files for fast lookup
             json_files_in_zip: Set[str] = {
                 info.filename for info in zip_ref.infolist()
                 if info.filename.endswith('.json')
             }
 
-            # Track date sources for debugging
-            json_count = 0
-            exif_count = 0
-            zip_meta_count = 0
-            fallback_count = 0
+            # Index JSON files by (directory, leading chars of name) for truncated-name lookups
+            json_by_prefix: Dict[Tuple[str, str], List[str]] = defaultdict(list)
+            for json_file in json_files_in_zip:
+                json_dir, _, json_name = json_file.rpartition('/')
+                if len(json_name) >= SIDECAR_PREFIX_LEN:
+                    json_by_prefix[(json_dir, json_name[:SIDECAR_PREFIX_LEN])].append(json_file)
 
-            for file_info in file_infos:
-                date = None
-                source = None
+            sources['json_files'] = len(json_files_in_zip)
+
+            found_dates: Dict[ZipFileInfo, datetime] = {}
+            exif_candidates: List[ZipFileInfo] = []
 
-                # Try JSON sidecar first (most reliable for Google Takeout)
-                date = _try_json_sidecar_date(zip_ref, file_info, json_files_in_zip)
+            # Try JSON sidecar first (most reliable for Google Takeout)
+            for file_info in file_infos:
+                date = _try_json_sidecar_date(zip_ref, file_info, json_files_in_zip, json_by_prefix, zip_map)
+                if date:
+                    found_dates[file_info] = date
+                    sources['json'] += 1
+                elif file_info.suffix_lower in EXIF_EXTENSIONS and file_info.file_size > 0:
+                    exif_candidates.append(file_info)
+
+            # Fallback to EXIF (only for images). The header reads are batched and
+            # issued in archive order so they walk the zip front to back rather
+            # than seeking back and forth between sidecars and images.
+            exif_candidates.sort(key=lambda f: zip_ref.getinfo(f.file_path).header_offset)
+            for file_info in exif_candidates:
+                date = _try_exif_date(zip_ref, file_info)
                 if date:
-                    source = "json"
-                    json_count += 1
+                    found_dates[file_info] = date
+                    sources['exif'] += 1
 
-                # Fallback to EXIF (only for images)
-                if not date:
-                    ext = Path(file_info.file_path).suffix.lower()
-                    if ext in EXIF_EXTENSIONS and file_info.file_size > 0:
-                        date = _try_exif_date(zip_ref, file_info)
-                        if date:
-                            source = "exif"
-                            exif_count += 1
+            for file_info in file_infos:
+                date = found_dates.get(file_info)
 
                 # Fallback to zip metadata
                 if not date:
                     date = file_info.get_zip_date()
                     if date:
-                        source = "zip_meta"
-                        zip_meta_count += 1
+                        sources['zip_meta'] += 1
 
                 # Final fallback to zip file mtime
                 if not date:
-                    date = datetime.fromtimestamp(zip_path.stat().st_mtime)
-                    source = "fallback"
-                    fallback_count += 1
-
-                # Save to cache
-                if cache:
-                    cache.set_date(file_info.zip_path, file_info.file_path,
-                                   file_info.file_size, file_info.file_crc, date)
-
-                result_queue.put((file_info, date))
-
-            # Log date source summary for this zip
-            if len(file_infos) > 0:
-                console.print(
-                    f"[dim]  {zip_path.name}: "
-                    f"json={json_count} exif={exif_count} zip={zip_meta_count} fallback={fallback_count} "
-                    f"(total JSON files in zip: {len(json_files_in_zip)})[/dim]"
-                )
+                    date = zip_mtime_fallback
+                    sources['fallback'] += 1
+
+                results.append((file_info, date))
     except Exception:
+        # Start over so no file is reported twice
+        results = []
+        sources = Counter()
         for file_info in file_infos:
             date = file_info.get_zip_date()
-            if not date:
-                date = datetime.fromtimestamp(zip_path.stat().st_mtime)
+            if date:
+                sources['zip_meta'] += 1
+            else:
+                date = zip_mtime_fallback
+                sources['fallback'] += 1
+
+            results.append((file_info, date))
+    finally:
+        if zip_map is not None:
+            zip_map.close()
+
+    # Save to cache in one batch per zip
+    if cache:
+        cache.set_dates_bulk([
+            (f.zip_path, f.file_path, f.file_size, f.file_crc, date)
+            for f, date in results
+        ])
+
+    return zip_path, results, sources
+
+
+# Pseudo-marker from _jpeg_segments: the buffer ended before the start of scan
+_JPEG_TRUNCATED = -1
+
+
+def _jpeg_segments(buf: bytes) -> Iterator[Tuple[int, int, int]]:
+    """
+    Walk the marker segments of a JPEG buffer, starting after SOI.
+
+    The walk stops after the start of scan (marker 0xDA, yielded with
+    length 0) or at bytes that aren't a marker. If the buffer ends before
+    the scan, a final _JPEG_TRUNCATED entry marks where to continue.
+
+    Args:
+        buf: Leading bytes of a JPEG file
+
+    Yields:
+        Tuples of (marker, offset of its 0xFF byte, segment length field)
+    """
+    pos = 2
+    while pos + 4 <= len(buf):
+        if buf[pos] != 0xFF:
+            return
+        marker = buf[pos + 1]
+        if marker == 0xFF:  # Fill byte
+            pos += 1
+            continue
+        if marker == 0xDA:  # Start of scan: no metadata after this
+            yield marker, pos, 0
+            return
+        length = (buf[pos + 2] << 8) | buf[pos + 3]
+        yield marker, pos, length
+        pos += 2 + length
+
+    yield _JPEG_TRUNCATED, pos, 0
+
+
+def _find_tiff_header(buf: bytes) -> Optional[int]:
+    """
+    Locate the TIFF header holding EXIF data in a JPEG or TIFF buffer.
+
+    Args:
+        buf: Leading bytes of the image file
+
+    Returns:
+        Offset of the TIFF header, or None if there is no EXIF block
+    """
+    # TIFF files start with the header itself
+    if buf[:4] in (b"II*\x00", b"MM\x00*"):
+        return 0
+
+    if buf[:2] != b"\xff\xd8":
+        return None
+
+    for marker, pos, _ in _jpeg_segments(buf):
+        if marker == 0xE1 and buf[pos + 4:pos + 10] == b"Exif\x00\x00":
+            return pos + 10
+
+    return None
+
+
+def _needs_more_header(buf: bytes) -> bool:
+    """
+    Check whether more of an image must be read before parsing EXIF.
+
+    JPEG metadata segments all come before the start of scan, so reading
+    can stop once the segment walk reaches it. TIFF IFDs can point
+    anywhere, so TIFF data is read up to the limit; other formats carry
+    no EXIF we parse and need nothing further.
+
+    Args:
+        buf: Leading bytes of the image file read so far
+
+    Returns:
+        True if another chunk should be read
+    """
+    if buf[:4] in (b"II*\x00", b"MM\x00*"):
+        return True
 
-            if cache:
-                cache.set_date(file_info.zip_path, file_info.file_path,
-                               file_info.file_size, file_info.file_crc, date)
+    if buf[:2] != b"\xff\xd8":
+        return False
 
-            result_queue.put((file_info, date))
+    return any(marker == _JPEG_TRUNCATED for marker, _, _ in _jpeg_segments(buf))
+
+
+def _read_ifd(buf: bytes, tiff: int, offset: int, structs: tuple) -> Dict[int, tuple]:
+    """
+    Read one TIFF IFD into a dict of tag -> (type, count, value_or_offset).
+
+    Args:
+        buf: Buffer containing the TIFF data
+        tiff: Offset of the TIFF header in buf
+        offset: IFD offset relative to the TIFF header
+        structs: Byte-order specific structs from _TIFF_STRUCTS
+
+    Returns:
+        Entries of the IFD
+    """
+    u16, _, entry = structs
+    start = tiff + offset
+    count = u16.unpack_from(buf, start)[0]
+    entries = {}
+    for i in range(count):
+        tag, value_type, value_count, value = entry.unpack_from(buf, start + 2 + i * 12)
+        entries[tag] = (value_type, value_count, value)
+    return entries
+
+
+def _exif_timestamp(raw: bytes) -> datetime:
+    """
+    Convert an EXIF "YYYY:MM:DD HH:MM:SS" byte string to a datetime.
+
+    Equivalent to strptime with "%Y:%m:%d %H:%M:%S" for well-formed
+    values, but works on the fixed digit positions directly.
+
+    Args:
+        raw: Date bytes as stored in the EXIF entry
+
+    Returns:
+        Parsed datetime
+
+    Raises:
+        ValueError: If the value is not a valid EXIF timestamp
+    """
+    if (len(raw) < 19 or raw[4] != 0x3A or raw[7] != 0x3A or raw[10] != 0x20
+            or raw[13] != 0x3A or raw[16] != 0x3A
+            or not raw[:19].translate(None, b": ").isdigit()):
+        raise ValueError(f"Invalid EXIF timestamp: {raw[:19]!r}")
+    return datetime(
+        int(raw[0:4]), int(raw[5:7]), int(raw[8:10]),
+        int(raw[11:13]), int(raw[14:16]), int(raw[17:19]),
+    )
+
+
+def _parse_exif_datetime(buf: bytes) -> Optional[datetime]:
+    """
+    Read DateTimeOriginal/DateTime straight from the EXIF bytes.
+
+    Only the TIFF structures needed for the two date tags are parsed, so
+    no image object is created.
+
+    Args:
+        buf: Leading bytes of a JPEG or TIFF file
+
+    Returns:
+        datetime if found, None if missing or the data could not be parsed
+    """
+    try:
+        tiff = _find_tiff_header(buf)
+        if tiff is None:
+            return None
+
+        structs = _TIFF_STRUCTS.get(buf[tiff:tiff + 2])
+        if structs is None:
+            return None
+        u16, u32, _ = structs
+        if u16.unpack_from(buf, tiff + 2)[0] != 42:
+            return None
+
+        ifd0 = _read_ifd(buf, tiff, u32.unpack_from(buf, tiff + 4)[0], structs)
+
+        candidates = []
+        if EXIF_TAG_EXIF_IFD in ifd0:
+            exif_ifd = _read_ifd(buf, tiff, ifd0[EXIF_TAG_EXIF_IFD][2], structs)
+            candidates.append(exif_ifd.get(EXIF_TAG_DATETIME_ORIGINAL))
+        candidates.append(ifd0.get(EXIF_TAG_DATETIME))
+
+        for tag_entry in candidates:
+            if tag_entry is None:
+                continue
+            _, value_count, value_offset = tag_entry
+            # Date strings are 20 bytes ("YYYY:MM:DD HH:MM:SS\0"), always stored by offset
+            raw = buf[tiff + value_offset:tiff + value_offset + value_count]
+            return _exif_timestamp(raw)
+
+    except (struct.error, ValueError):
+        pass
+
+    return None
 
 
 def _try_exif_date(zip_ref: zipfile.ZipFile, file_info: ZipFileInfo) -> Optional[datetime]:
     """
     Try to extract EXIF date from an image file.
 
+    The raw EXIF parser handles the common case; Pillow is only used when
+    it finds nothing.
+
     Args:
         zip_ref: Open ZipFile reference
         file_info: File to extract from
@@ -214,33 +484,76 @@ def _try_exif_date(zip_ref: zipfile.ZipFile, file_info: ZipFileInfo) -> Optional
     """
     try:
         with zip_ref.open(file_info.file_path) as f:
-            # Read just enough to get EXIF (usually in first 64KB)
-            file_bytes = io.BytesIO(f.read(65536))
+            # Read just enough to get EXIF: up to the JPEG start of scan, at most 64KB,
+            # so compressed members aren't inflated further than needed
+            buf = f.read(EXIF_READ_CHUNK)
+            while len(buf) < EXIF_READ_LIMIT and _needs_more_header(buf):
+                chunk = f.read(min(EXIF_READ_CHUNK, EXIF_READ_LIMIT - len(buf)))
+                if not chunk:
+                    break
+                buf += chunk
+
+        date = _parse_exif_datetime(buf)
+        if date:
+            return date
+
+        # Only JPEG (SOI marker) and TIFF data can carry EXIF here
+        if buf[:2] != b"\xff\xd8" and buf[:4] not in (b"II*\x00", b"MM\x00*"):
+            return None
+
+        # Image.open only parses headers; pixel data is never loaded
+        with Image.open(io.BytesIO(buf)) as img:
+            exif = img.getexif()
+            if not exif:
+                return None
+
+            # DateTimeOriginal lives in the Exif sub-IFD, DateTime in IFD0
+            value = exif.get_ifd(EXIF_TAG_EXIF_IFD).get(EXIF_TAG_DATETIME_ORIGINAL) or exif.get(EXIF_TAG_DATETIME)
+            if value:
+                return datetime.strptime(value, "%Y:%m:%d %H:%M:%S")
 
-            with Image.open(file_bytes) as img:
-                exif_data = img._getexif()
+    except Exception:
+        pass
 
-                if not exif_data:
-                    return None
+    return None
 
-                # Look for DateTimeOriginal (tag 36867) first
-                if 36867 in exif_data:
-                    return datetime.strptime(exif_data[36867], "%Y:%m:%d %H:%M:%S")
 
-                # Fallback to DateTime (tag 306)
-                if 306 in exif_data:
-                    return datetime.strptime(exif_data[306], "%Y:%m:%d %H:%M:%S")
+def _read_zip_member(zip_ref: zipfile.ZipFile, name: str, zip_map: Optional[mmap.mmap]) -> bytes:
+    """
+    Read a zip member, slicing STORED/DEFLATED data straight from the mmap.
 
-    except Exception:
-        pass
+    Skips the ZipExtFile wrapper (and its CRC check), which dominates for
+    small files like sidecars. Anything unusual goes through zip_ref.read().
 
-    return None
+    Args:
+        zip_ref: Open ZipFile reference
+        name: Member name
+        zip_map: Read-only mmap of the same archive, or None
+
+    Returns:
+        The member's uncompressed bytes
+    """
+    info = zip_ref.getinfo(name)
+    if zip_map is not None and not info.flag_bits & 0x1:  # Not encrypted
+        offset = info.header_offset
+        if zip_map[offset:offset + 4] == b"PK\x03\x04":
+            name_len, extra_len = struct.unpack_from("<HH", zip_map, offset + 26)
+            start = offset + 30 + name_len + extra_len
+            data = zip_map[start:start + info.compress_size]
+            if info.compress_type == zipfile.ZIP_STORED:
+                return data
+            if info.compress_type == zipfile.ZIP_DEFLATED:
+                return zlib.decompress(data, -15)
+
+    return zip_ref.read(name)
 
 
 def _try_json_sidecar_date(
     zip_ref: zipfile.ZipFile,
     file_info: ZipFileInfo,
-    json_files_in_zip: Set[str]
+    json_files_in_zip: Set[str],
+    json_by_prefix: Dict[Tuple[str, str], List[str]],
+    zip_map: Optional[mmap.mmap] = None
 ) -> Optional[datetime]:
     """
     Try to extract date from Google Takeout JSON sidecar file.
@@ -252,43 +565,47 @@ def _try_json_sidecar_date(
         zip_ref: Open ZipFile reference
         file_info: File to find sidecar for
         json_files_in_zip: Set of JSON file paths in the zip for fast lookup
+        json_by_prefix: JSON file paths keyed by (directory, first SIDECAR_PREFIX_LEN
+            chars of the name), for truncated filenames
+        zip_map: Optional read-only mmap of the archive for direct reads
 
     Returns:
         datetime if found, None otherwise
     """
     file_path = file_info.file_path
-    file_dir = str(Path(file_path).parent)
-    file_name = Path(file_path).name
-    file_stem = Path(file_path).stem
+    file_dir = file_info.parent_dir
+    file_name = file_info.basename
+    file_stem = file_info.stem
 
     # Try various sidecar naming patterns Google Takeout uses
     possible_json_paths = [
         f"{file_path}.json",                              # photo.jpg.json (most common)
-        f"{file_dir}/{file_stem}.json" if file_dir != "." else f"{file_stem}.json",  # photo.json
+        f"{file_dir}/{file_stem}.json" if file_dir else f"{file_stem}.json",  # photo.json
     ]
 
     # Also try matching by prefix for truncated filenames
     # Google Takeout truncates long filenames but keeps the JSON
-    if len(file_name) > 40:
-        prefix = file_name[:40]
-        for json_file in json_files_in_zip:
-            json_name = Path(json_file).name
-            if json_name.startswith(prefix) and json_name.endswith('.json'):
-                possible_json_paths.append(json_file)
+    if len(file_name) > SIDECAR_PREFIX_LEN:
+        possible_json_paths.extend(json_by_prefix.get((file_dir, file_name[:SIDECAR_PREFIX_LEN]), ()))
 
     for json_path in possible_json_paths:
         if json_path not in json_files_in_zip:
             continue
 
         try:
-            with zip_ref.open(json_path) as f:
-                data = json.load(f)
+            raw = _read_zip_member(zip_ref, json_path, zip_map)
 
-                # Only use photoTakenTime - this is the actual photo date
-                # (creationTime is often the export date, not the photo date)
-                if 'photoTakenTime' in data and 'timestamp' in data['photoTakenTime']:
-                    timestamp = int(data['photoTakenTime']['timestamp'])
-                    return datetime.fromtimestamp(timestamp)
+            # Only use photoTakenTime - this is the actual photo date
+            # (creationTime is often the export date, not the photo date)
+            match = _PHOTO_TAKEN_TIMESTAMP_RE.search(raw)
+            if match:
+                return datetime.fromtimestamp(int(match.group(1)))
+
+            # Unusual layout or encoding: fall back to a full parse
+            data = json.loads(raw)
+            if 'photoTakenTime' in data and 'timestamp' in data['photoTakenTime']:
+                timestamp = int(data['photoTakenTime']['timestamp'])
+                return datetime.fromtimestamp(timestamp)
 
         except Exception:
             pass
@@ -296,11 +613,48 @@ def _try_json_sidecar_date(
     return None
 
 
+# Handles returned by _open_zip, so close_all_zips() can reach them (evicted ones are
+# closed when garbage collected)
+_open_zip_handles: "weakref.WeakSet[zipfile.ZipFile]" = weakref.WeakSet()
+
+
+@lru_cache(maxsize=MAX_WORKERS * 2)
+def _open_zip(zip_path: Path) -> zipfile.ZipFile:
+    """
+    Open a zip for reading, reusing the handle for later calls.
+
+    The central directory is parsed once per zip instead of once per file.
+    ZipFile.open() is safe to call from several threads on one handle.
+
+    Args:
+        zip_path: Path to the zip archive
+
+    Returns:
+        Shared read-only ZipFile
+    """
+    zip_ref = zipfile.ZipFile(zip_path, 'r')
+    _open_zip_handles.add(zip_ref)
+    return zip_ref
+
+
+def close_all_zips() -> None:
+    """Close every zip handle opened by _open_zip and clear the cache."""
+    _open_zip.cache_clear()
+    for zip_ref in list(_open_zip_handles):
+        zip_ref.close()
+    _open_zip_handles.clear()
+
+
+atexit.register(close_all_zips)
+
+
+@lru_cache(maxsize=4096)
 def extract_date(file_info: ZipFileInfo) -> datetime:
     """
     Extract date from a file (legacy single-file interface).
 
-    For batch processing, use extract_dates_batch() instead.
+    For batch processing, use extract_dates_batch() instead. Results are
+    memoized per file, and zips are opened once via _open_zip().
 
     Args:
         file_info: ZipFileInfo object representing the file
@@ -310,7 +664,7 @@ def extract_date(file_info: ZipFileInfo) -> datetime:
     """
     zip_date = file_info.get_zip_date()
 
-    ext = Path(file_info.file_path).suffix.lower()
+    ext = file_info.suffix_lower
     if ext in EXIF_EXTENSIONS:
         exif_date = _extract_exif_date_single(file_info)
         if exif_date:
@@ -323,9 +677,8 @@ def extract_date(file_info: ZipFileInfo) -> datetime:
 
 
 def _extract_exif_date_single(file_info: ZipFileInfo) -> Optional[datetime]:
-    """Extract EXIF date from a single file (opens zip each time - slow)."""
+    """Extract EXIF date from a single file using the shared zip handle."""
     try:
-        with zipfile.ZipFile(file_info.zip_path, 'r') as zip_ref:
-            return _try_exif_date(zip_ref, file_info)
+        return _try_exif_date(_open_zip(file_info.zip_path), file_info)
     except Exception:
         return None
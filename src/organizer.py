@@ -1,8 +1,13 @@
 """Organizer module for proposing file extraction locations."""
+import os
 from datetime import datetime
 from pathlib import Path
+from typing import Dict, Tuple
 from scanner import ZipFileInfo
 
+# (base_dir, year, month) -> "{base_dir}/{year}/{month}"; files share few distinct months
+_subdir_cache: Dict[Tuple[str, int, int], str] = {}
+
 
 def propose_location(file_info: ZipFileInfo, file_date: datetime, base_dir: str = "extracted") -> str:
     """
@@ -19,12 +24,13 @@ def propose_location(file_info: ZipFileInfo, file_date: datetime, base_dir: str
     Returns:
         Proposed relative path as a string
     """
-    year = file_date.strftime("%Y")
-    month = file_date.strftime("%m")
-    # Extract filename from the path inside the zip
-    filename = Path(file_info.file_path).name
-
-    # Construct the proposed path
-    proposed_path = Path(base_dir) / year / month / filename
+    key = (base_dir, file_date.year, file_date.month)
+    subdir = _subdir_cache.get(key)
+    if subdir is None:
+        year = file_date.strftime("%Y")
+        month = file_date.strftime("%m")
+        subdir = str(Path(base_dir) / year / month)
+        _subdir_cache[key] = subdir
 
-    return str(proposed_path)
+    # Construct the proposed path from the filename inside the zip
+    return subdir + os.sep + file_info.basename
@@ -2,7 +2,7 @@
 import sys
 import time
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from rich.console import Console, Group
 from rich.live import Live
 from rich.panel import Panel
@@ -69,17 +69,20 @@ class ProgressStats:
     def elapsed(self) -> float:
         return time.time() - self.start_time
 
+    def rates(self) -> Tuple[float, float]:
+        """Get (files_per_second, bytes_per_second) from a single clock read."""
+        elapsed = self.elapsed
+        if elapsed == 0:
+            return 0, 0
+        return self.completed_files / elapsed, self.processed_bytes / elapsed
+
     @property
     def files_per_second(self) -> float:
-        if self.elapsed == 0:
-            return 0
-        return self.completed_files / self.elapsed
+        return self.rates()[0]
 
     @property
     def bytes_per_second(self) -> float:
-        if self.elapsed == 0:
-            return 0
-        return self.processed_bytes / self.elapsed
+        return self.rates()[1]
 
     @property
     def percent_complete(self) -> float:
@@ -89,10 +92,11 @@ class ProgressStats:
 
     @property
     def eta_seconds(self) -> Optional[float]:
-        if self.files_per_second == 0:
+        files_per_second = self.files_per_second
+        if files_per_second == 0:
             return None
         remaining = self.total_files - self.completed_files
-        return remaining / self.files_per_second
+        return remaining / files_per_second
 
 
 class HashingProgressDisplay:
@@ -116,66 +120,100 @@ class HashingProgressDisplay:
             expand=False
         )
         self.task_id = self.progress.add_task("Hashing", total=total_files)
+        self._build_display()
 
-    def _create_display(self) -> Panel:
-        """Create the display panel."""
+    def _build_display(self) -> None:
+        """
+        Build the display panel once.
+
+        Values live in Text objects that _create_display() updates in place,
+        so a refresh doesn't allocate new tables, panels or markup.
+        """
         # Stats table
-        stats_table = Table.grid(padding=(0, 2))
-        stats_table.add_column(style="cyan", justify="right")
-        stats_table.add_column(style="white")
-        stats_table.add_column(style="cyan", justify="right")
-        stats_table.add_column(style="white")
-
-        stats_table.add_row(
-            "Files:", f"{self.stats.completed_files:,} / {self.stats.total_files:,}",
-            "Speed:", f"{self.stats.files_per_second:.1f} files/s"
-        )
-        stats_table.add_row(
-            "Data:", f"{format_size(self.stats.processed_bytes)} / {format_size(self.stats.total_bytes)}",
-            "Throughput:", f"{format_size(int(self.stats.bytes_per_second))}/s"
-        )
-        stats_table.add_row(
-            "Unique:", f"{self.stats.unique_files:,}",
-            "Duplicates:", f"[yellow]{self.stats.duplicates_found:,}[/yellow]"
-        )
-        if self.stats.errors > 0:
-            stats_table.add_row(
-                "Errors:", f"[red]{self.stats.errors:,}[/red]",
-                "", ""
-            )
+        self._files_text = Text()
+        self._speed_text = Text()
+        self._data_text = Text()
+        self._throughput_text = Text()
+        self._unique_text = Text()
+        self._duplicates_text = Text(style="yellow")
+        self._errors_text = Text(style="red")
+        self._errors_shown = False
+
+        self._stats_table = Table.grid(padding=(0, 2))
+        self._stats_table.add_column(style="cyan", justify="right")
+        self._stats_table.add_column(style="white")
+        self._stats_table.add_column(style="cyan", justify="right")
+        self._stats_table.add_column(style="white")
+        self._stats_table.add_row("Files:", self._files_text, "Speed:", self._speed_text)
+        self._stats_table.add_row("Data:", self._data_text, "Throughput:", self._throughput_text)
+        self._stats_table.add_row("Unique:", self._unique_text, "Duplicates:", self._duplicates_text)
 
         # Current file
-        current_text = Text()
-        current_text.append("Current: ", style="dim")
-        current_text.append(truncate_path(self.stats.current_file, 60) if self.stats.current_file else "...", style="white")
+        self._current_text = Text(style="white")
+        current_table = Table.grid()
+        current_table.add_column(style="dim")
+        current_table.add_column()
+        current_table.add_row("Current: ", self._current_text)
 
         # Recent files
+        self._recent_marks = [Text() for _ in range(4)]
+        self._recent_names = [Text() for _ in range(4)]
         recent_table = Table.grid(padding=(0, 1))
         recent_table.add_column(style="dim", width=3)
         recent_table.add_column(style="green")
-
-        for i, filename in enumerate(reversed(self.stats.recent_files[-4:])):
-            recent_table.add_row("✓", truncate_path(filename, 55))
+        for mark, name in zip(self._recent_marks, self._recent_names):
+            recent_table.add_row(mark, name)
 
         # Combine into groups
         content = Group(
             self.progress,
             Text(),
-            stats_table,
+            self._stats_table,
             Text(),
-            current_text,
+            current_table,
             Text(),
             Text("Recently completed:", style="dim"),
             recent_table
         )
 
-        return Panel(
+        self._panel = Panel(
             content,
             title=f"[bold]Hashing Files[/bold] [dim]({self.num_workers} workers)[/dim]",
             border_style="blue",
             padding=(1, 2)
         )
 
+    def _create_display(self) -> Panel:
+        """Update the display panel with the current stats."""
+        stats = self.stats
+        files_per_second, bytes_per_second = stats.rates()
+
+        self._files_text.plain = f"{stats.completed_files:,} / {stats.total_files:,}"
+        self._speed_text.plain = f"{files_per_second:.1f} files/s"
+        self._data_text.plain = f"{format_size(stats.processed_bytes)} / {format_size(stats.total_bytes)}"
+        self._throughput_text.plain = f"{format_size(int(bytes_per_second))}/s"
+        self._unique_text.plain = f"{stats.unique_files:,}"
+        self._duplicates_text.plain = f"{stats.duplicates_found:,}"
+
+        if stats.errors > 0:
+            if not self._errors_shown:
+                self._stats_table.add_row("Errors:", self._errors_text, "", "")
+                self._errors_shown = True
+            self._errors_text.plain = f"{stats.errors:,}"
+
+        self._current_text.plain = truncate_path(stats.current_file, 60) if stats.current_file else "..."
+
+        recent = list(reversed(stats.recent_files[-4:]))
+        for i, (mark, name) in enumerate(zip(self._recent_marks, self._recent_names)):
+            if i < len(recent):
+                mark.plain = "✓"
+                name.plain = truncate_path(recent[i], 55)
+            else:
+                mark.plain = ""
+                name.plain = ""
+
+        return self._panel
+
     def __enter__(self):
         self.progress.start()
         self.live = Live(
@@ -3,8 +3,9 @@ import os
 import sys
 import zipfile
 from pathlib import Path
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
@@ -12,14 +13,56 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 console = Console(legacy_windows=(sys.platform == "win32"))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ZipFileInfo:
-    """Represents a file inside a zip archive."""
+    """
+    Represents a file inside a zip archive.
+
+    Slotted: a takeout can hold hundreds of thousands of these, and dropping
+    the per-instance __dict__ makes each record several times smaller.
+    """
     zip_path: Path
     file_path: str
     file_size: int
     file_crc: int  # CRC32 from zip metadata - free duplicate detection!
     date_time: tuple  # (year, month, day, hour, minute, second) from zip metadata
+    # (parent_dir, basename), split on first use; not part of equality/hash
+    _name_parts: Optional[Tuple[str, str]] = field(default=None, init=False, repr=False, compare=False)
+
+    # Name parts of file_path, split with str ops (zip paths always use "/")
+    # instead of building a Path on every use
+
+    def _split_name(self) -> Tuple[str, str]:
+        parts = self._name_parts
+        if parts is None:
+            parent, _, name = self.file_path.rpartition('/')
+            parts = (parent, name)
+            object.__setattr__(self, '_name_parts', parts)
+        return parts
+
+    @property
+    def parent_dir(self) -> str:
+        """Directory part of file_path inside the zip ("" for the zip root)."""
+        return self._split_name()[0]
+
+    @property
+    def basename(self) -> str:
+        """File name without its directory."""
+        return self._split_name()[1]
+
+    @property
+    def stem(self) -> str:
+        """File name without its final suffix (like Path.stem)."""
+        name = self.basename
+        dot = name.rfind('.')
+        return name[:dot] if 0 < dot < len(name) - 1 else name
+
+    @property
+    def suffix_lower(self) -> str:
+        """Lowercased final suffix including the dot, or "" (like Path.suffix)."""
+        name = self.basename
+        dot = name.rfind('.')
+        return name[dot:].lower() if 0 < dot < len(name) - 1 else ""
 
     def get_display_path(self) -> str:
         """Get a human-readable path for display."""
@@ -42,7 +85,41 @@ class ZipFileInfo:
         return None
 
 
-def scan_directory(root_path: str) -> List[ZipFileInfo]:
+def _scan_one(zip_path: Path) -> Tuple[List[ZipFileInfo], Optional[float]]:
+    """
+    Read the central directory of one zip.
+
+    Args:
+        zip_path: Zip archive to read
+
+    Returns:
+        Tuple of (ZipFileInfo for every file entry, zip modification time);
+        ([], None) if the zip can't be read
+    """
+    try:
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            mtime = os.fstat(zip_ref.fp.fileno()).st_mtime
+            # Entries often share a timestamp (e.g. the export time); keep one tuple per value
+            date_times: dict = {}
+            return [
+                ZipFileInfo(
+                    zip_path=zip_path,
+                    file_path=zip_info.filename,
+                    file_size=zip_info.file_size,
+                    file_crc=zip_info.CRC,
+                    date_time=date_times.setdefault(zip_info.date_time, zip_info.date_time)
+                )
+                for zip_info in zip_ref.infolist()
+                if not zip_info.is_dir()  # Skip directories
+            ], mtime
+    except zipfile.BadZipFile:
+        console.print(f"[yellow]Warning: {zip_path.name} is not a valid zip file[/yellow]")
+    except Exception as e:
+        console.print(f"[yellow]Warning: Error reading {zip_path.name}: {e}[/yellow]")
+    return [], None
+
+
+def scan_directory(root_path: str) -> Tuple[List[ZipFileInfo], Dict[Path, float]]:
     """
     Scan a directory recursively for zip files and return all files found inside them.
 
@@ -50,28 +127,34 @@ def scan_directory(root_path: str) -> List[ZipFileInfo]:
         root_path: Root directory to scan for zip files (scans all subdirectories)
 
     Returns:
-        List of ZipFileInfo objects for all files found in zip archives
+        Tuple of (ZipFileInfo objects for all files found in zip archives,
+        modification time of each zip read, for the date fallback)
     """
     root = Path(root_path)
 
     if not root.exists():
         console.print(f"[red]Error: Directory '{root_path}' does not exist[/red]")
-        return []
+        return [], {}
 
     if not root.is_dir():
         console.print(f"[red]Error: '{root_path}' is not a directory[/red]")
-        return []
+        return [], {}
 
     # Find all zip files recursively
     zip_files = list(root.glob("**/*.zip"))
 
     if not zip_files:
         console.print(f"[yellow]Warning: No zip files found in {root_path}[/yellow]")
-        return []
+        return [], {}
 
     console.print(f"[cyan]Found {len(zip_files)} zip file(s) to scan[/cyan]")
 
-    all_files = []
+    # Zips are independent, so read their central directories in parallel.
+    # Results are kept in zip order so which duplicate counts as the original
+    # stays deterministic.
+    results: List[List[ZipFileInfo]] = [[] for _ in zip_files]
+    zip_mtimes: Dict[Path, float] = {}
+    found = 0
 
     with Progress(
         TextColumn("[progress.description]{task.description}"),
@@ -79,28 +162,20 @@ def scan_directory(root_path: str) -> List[ZipFileInfo]:
     ) as progress:
         task = progress.add_task("Scanning zip files...", total=None)
 
-        for zip_path in zip_files:
-            try:
-                with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                    for zip_info in zip_ref.infolist():
-                        # Skip directories
-                        if not zip_info.is_dir():
-                            file_info = ZipFileInfo(
-                                zip_path=zip_path,
-                                file_path=zip_info.filename,
-                                file_size=zip_info.file_size,
-                                file_crc=zip_info.CRC,
-                                date_time=zip_info.date_time
-                            )
-                            all_files.append(file_info)
-                            progress.update(
-                                task,
-                                description=f"Scanning zip files... ({len(all_files)} files found)"
-                            )
-            except zipfile.BadZipFile:
-                console.print(f"[yellow]Warning: {zip_path.name} is not a valid zip file[/yellow]")
-            except Exception as e:
-                console.print(f"[yellow]Warning: Error reading {zip_path.name}: {e}[/yellow]")
+        with ThreadPoolExecutor(max_workers=min(32, len(zip_files))) as executor:
+            futures = {executor.submit(_scan_one, zip_path): i for i, zip_path in enumerate(zip_files)}
+            for future in as_completed(futures):
+                zip_entries, mtime = future.result()
+                results[futures[future]] = zip_entries
+                if mtime is not None:
+                    zip_mtimes[zip_files[futures[future]]] = mtime
+                found += len(zip_entries)
+                progress.update(
+                    task,
+                    description=f"Scanning zip files... ({found} files found)"
+                )
+
+    all_files = [file_info for zip_entries in results for file_info in zip_entries]
 
     console.print(f"[green]Found {len(all_files)} files in {len(zip_files)} zip archive(s)[/green]")
-    return all_files
+    return all_files, zip_mtimes